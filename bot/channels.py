@@ -7,6 +7,7 @@ from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 
 from bot.helpers import _md, _answer_bg, _nav_row, _edit_msg, MD2
+from data.starter_channels import load_starter_channels
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,11 @@ class ChannelMixin:
 
     # --- Starter channels ---
 
+    @property
+    def _starter_channels(self) -> list[dict]:
+        """Starter channels, parsed on first use and re-read when the file changes."""
+        return load_starter_channels(self._starter_channels_path)
+
     async def _channel_starter(self, update: Update, store=None) -> None:
         """Handle /channel starter — show importable starter channels."""
         if not self._starter_channels:
@@ -67,7 +73,8 @@ class ChannelMixin:
         """Build starter channels message with per-channel Import buttons and pagination."""
         s = store or self.video_store
         existing = s.get_channel_handles_set()
-        total = len(self._starter_channels)
+        channels = self._starter_channels
+        total = len(channels)
         ps = self._STARTER_PAGE_SIZE
         start = page * ps
         end = min(start + ps, total)
@@ -82,7 +89,7 @@ class ChannelMixin:
         lines = [header, ""]
         buttons = []
         for idx in range(start, end):
-            ch = self._starter_channels[idx]
+            ch = channels[idx]
             handle = ch["handle"]
             name = ch["name"]
             cat = ch.get("category") or ""
@@ -125,11 +132,12 @@ class ChannelMixin:
 
     async def _cb_starter_import(self, query, profile_id: str, idx: int) -> None:
         """Handle Import button press from starter channels message."""
-        if idx < 0 or idx >= len(self._starter_channels):
+        channels = self._starter_channels
+        if idx < 0 or idx >= len(channels):
             await query.answer(self.tr("Invalid channel."))
             return
         cs = self._child_store(profile_id)
-        ch = self._starter_channels[idx]
+        ch = channels[idx]
         handle = ch["handle"]
         name = ch["name"]
         cat = ch.get("category")
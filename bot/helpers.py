@@ -1,6 +1,7 @@
 """Shared bot helpers: markdown formatting, callback utilities, pagination."""
 
 import asyncio
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import quote
 
@@ -21,6 +22,12 @@ def _md(text: str) -> str:
         return text
 
 
+@lru_cache(maxsize=256)
+def _md_cached(text: str) -> str:
+    """Memoized _md() for menu and prompt text that repeats on every render."""
+    return _md(text)
+
+
 def _answer_bg(query, text: str = "") -> None:
     """Fire answerCallbackQuery in background so it never blocks the message edit."""
     async def _do():
@@ -50,11 +57,15 @@ def _nav_row(page: int, total: int, page_size: int, callback_prefix: str,
     ]
 
 
-async def _edit_msg(query, text: str, markup=None, disable_preview: bool = False) -> None:
-    """Edit a callback query message, silently ignoring timeouts/conflicts."""
+async def _edit_msg(query, text: str, markup=None, disable_preview: bool = False,
+                    markdown: bool = True) -> None:
+    """Edit a callback query message, silently ignoring timeouts/conflicts.
+
+    Pass markdown=False for plain text that has not been through _md().
+    """
     try:
         await query.edit_message_text(
-            text=text, parse_mode=MD2, reply_markup=markup,
+            text=text, parse_mode=MD2 if markdown else None, reply_markup=markup,
             disable_web_page_preview=disable_preview,
         )
     except Exception:
@@ -381,16 +381,6 @@ class SetupMixin:
         _answer_bg(query)
         await self._edit_hub(query)
 
-    async def _send_onboard_time_return(self, chat_id: int) -> None:
-        """After time setup wizard completes, send fresh time sub-menu."""
-        text, markup = self._build_time_submenu()
-        try:
-            await self._app.bot.send_message(
-                chat_id=chat_id, text=text, parse_mode=MD2, reply_markup=markup,
-            )
-        except Exception as e:
-            logger.error(f"Failed to send onboard time return: {e}")
-
     # --- Shorts section ---
 
     def _build_shorts_submenu(self, selected_profile_id: str = "", selected_name: str = "") -> tuple[str, InlineKeyboardMarkup]:
@@ -471,12 +461,23 @@ class SetupMixin:
 
     # --- Onboard return from time wizard ---
 
-    async def _maybe_onboard_return(self, chat_id: int) -> None:
-        """If the time wizard was launched from the setup hub, send time sub-menu."""
+    def _pop_onboard_return(self, chat_id: int) -> bool:
+        """End a time wizard launched from the setup hub. Returns True if it was."""
         state = self._pending_wizard.get(chat_id, {})
         if state.get("onboard_return"):
-            await self._send_onboard_time_return(chat_id)
             self._pending_wizard.pop(chat_id, None)
+            return True
+        return False
+
+    def _with_onboard_return(self, text: str, onboard: bool) -> tuple[str, InlineKeyboardMarkup | None]:
+        """Append the time sub-menu to a finished wizard message when returning to the hub.
+
+        The summary and the sub-menu go out as one message instead of two.
+        """
+        if not onboard:
+            return text, None
+        menu_text, markup = self._build_time_submenu()
+        return f"{text}\n\n{menu_text}", markup
 
     # --- Onboard text reply handler ---
 
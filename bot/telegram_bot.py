@@ -36,6 +36,7 @@ from i18n import (
     get_time_format,
     t,
 )
+from utils import DAY_NAMES
 
 logger = logging.getLogger(__name__)
 
@@ -48,24 +49,37 @@ class BrainRotGuardBot(SetupMixin, ApprovalMixin, ChannelMixin, TimeLimitMixin,
         self.bot_token = bot_token
         self.admin_chat_id = admin_chat_id
         self.admin_chat_target = self._normalize_chat_target(admin_chat_id)
+        # Telegram ids are ints; a non-numeric admin_chat_id can never match
+        self._admin_ids = (
+            frozenset({self.admin_chat_target}) if isinstance(self.admin_chat_target, int) else frozenset()
+        )
         self.video_store = video_store
         self.config = config
         self.locale = get_locale(config)
         self.time_format = get_time_format(config)
+        self._day_labels = {
+            (day, short): day_label(day, self.locale, short=short)
+            for day in DAY_NAMES for short in (False, True)
+        }
         self._app = None
+        self._child_stores: dict[str, ChildStore] = {}  # profile_id -> stateless scoped view
         self._limit_notified_cats: dict[tuple, str] = {}  # (profile_id, category) -> date
         self._pending_wizard: dict[int, dict] = {}  # chat_id -> wizard state for custom input
+        self._wizard_keyboards: dict = {}  # key -> static time-wizard InlineKeyboardMarkup
+        self._wizard_locks: dict[int, asyncio.Lock] = {}  # chat_id -> serializes time-wizard steps
+        self._wizard_taps: set[tuple] = set()  # (chat_id, message_id, data) wizard taps in flight
         self._pending_cmd: dict[int, dict] = {}  # chat_id -> pending child-scoped command
         self.on_channel_change = None  # callback when channel lists change
         self.on_video_change = None  # callback when video status changes
         self._update_check_task = None  # background version check loop
-        # Load starter channels
-        from data.starter_channels import load_starter_channels
-        self._starter_channels = load_starter_channels(starter_channels_path)
+        self._starter_channels_path = starter_channels_path  # parsed on first use
 
     def _child_store(self, profile_id: str) -> ChildStore:
-        """Get a ChildStore for a specific profile."""
-        return ChildStore(self.video_store, profile_id)
+        """Get a ChildStore for a specific profile (one shared instance per profile_id)."""
+        cs = self._child_stores.get(profile_id)
+        if cs is None:
+            cs = self._child_stores[profile_id] = ChildStore(self.video_store, profile_id)
+        return cs
 
     def _get_profiles(self) -> list[dict]:
         """Get all profiles."""
@@ -105,8 +119,9 @@ class BrainRotGuardBot(SetupMixin, ApprovalMixin, ChannelMixin, TimeLimitMixin,
         return category_label(category, self.locale, short=short)
 
     def day_label(self, day: str, short: bool = False) -> str:
-        """Localized day label."""
-        return day_label(day, self.locale, short=short)
+        """Localized day label (precomputed for the seven canonical days)."""
+        label = self._day_labels.get((day, short))
+        return label if label is not None else day_label(day, self.locale, short=short)
 
     def fmt_time(self, hhmm: str | None, compact: bool = False) -> str | None:
         """Localized time formatter."""
@@ -170,11 +185,10 @@ class BrainRotGuardBot(SetupMixin, ApprovalMixin, ChannelMixin, TimeLimitMixin,
         - DM from admin user (effective_user.id == admin_chat_id)
         - Message/callback in admin group chat (effective_chat.id == admin_chat_id)
         """
-        if not self.admin_chat_id:
+        admin_ids = self._admin_ids
+        if not admin_ids:
             return False
-        admin = str(self.admin_chat_id)
-        return (str(update.effective_chat.id) == admin
-                or str(update.effective_user.id) == admin)
+        return update.effective_chat.id in admin_ids or update.effective_user.id in admin_ids
 
     async def _require_admin(self, update: Update) -> bool:
         """Check admin access; send denial if unauthorized. Returns True if authorized."""
@@ -473,6 +487,9 @@ class BrainRotGuardBot(SetupMixin, ApprovalMixin, ChannelMixin, TimeLimitMixin,
                 elif route.prefix in ("unallow", "unblock"):
                     # Channel remove needs the action prefix as first arg
                     await handler(query, route.prefix, *args)
+                elif route.prefix.startswith("setup_") or route.prefix == "switch_confirm":
+                    # Time wizard: one step at a time per chat, double taps dropped
+                    await self._run_wizard_callback(query, lambda: handler(query, *args))
                 else:
                     await handler(query, *args)
             except (ValueError, IndexError):
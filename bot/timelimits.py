@@ -1,11 +1,13 @@
 """Time limits mixin: /time command, schedule, category limits, setup wizard, wizard reply handler."""
 
+import asyncio
 import logging
+import re
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 
-from bot.helpers import _md, _answer_bg, _edit_msg, MD2
+from bot.helpers import _md, _md_cached, _answer_bg, _edit_msg, MD2
 from data.child_store import ChildStore
 from utils import (
     get_today_str, get_day_utc_bounds, get_weekday, parse_time_input,
@@ -16,9 +18,32 @@ from utils import (
 logger = logging.getLogger(__name__)
 
 
+# Every possible bar for the widths used by /time status, indexed by filled cells
+_PROGRESS_BARS = {
+    width: tuple("\u2593" * i + "\u2591" * (width - i) for i in range(width + 1))
+    for width in (10, 20)
+}
+
+# switch_confirm payloads: {pid}:simple:{minutes} and {pid}:category:{edu|fun}:{minutes}
+_SWITCH_SIMPLE_RE = re.compile(r"([^:]+):simple:(\d+)")
+_SWITCH_CATEGORY_RE = re.compile(r"([^:]+):category:(edu|fun):(\d+)")
+
+# Time presets offered by the schedule wizard pickers
+_START_PRESETS = ("07:00", "08:00", "09:00")
+_STOP_PRESETS = ("19:00", "20:00", "21:00")
+_DAY_START_PRESETS = ("08:00", "09:00", "10:00")
+_DAY_STOP_PRESETS = ("20:00", "21:00", "22:00")
+
+# Day-grid rows: Mon-Thu on the first row, Fri-Sun on the second
+_DAY_GRID_ROWS = (DAY_NAMES[:4], DAY_NAMES[4:])
+
+
 def _progress_bar(fraction: float, width: int = 20) -> str:
-    filled = min(width, int(fraction * width))
-    return "\u2593" * filled + "\u2591" * (width - filled)
+    filled = max(0, min(width, int(fraction * width)))
+    bars = _PROGRESS_BARS.get(width)
+    if bars is None:
+        return "\u2593" * filled + "\u2591" * (width - filled)
+    return bars[filled]
 
 
 class TimeLimitMixin:
@@ -26,13 +51,58 @@ class TimeLimitMixin:
 
     _OVERRIDE_KEYS = ("schedule_start", "schedule_end", "edu_limit_minutes",
                       "fun_limit_minutes", "daily_limit_minutes")
+    # Every {day}_{key} override setting, precomputed for the single-query check
+    _DAY_OVERRIDE_KEYS = tuple(f"{day}_{key}" for key in _OVERRIDE_KEYS for day in DAY_NAMES)
+    # Default + per-day schedule settings, fetched together for the schedule wizard
+    _SCHEDULE_KEYS = ("schedule_start", "schedule_end") + tuple(
+        f"{day}_{key}" for key in ("schedule_start", "schedule_end") for day in DAY_NAMES
+    )
+    # Text-reply handlers by step kind: time steps receive a parsed "HH:MM",
+    # limit steps a positive number of minutes.
+    _WIZARD_TIME_REPLIES = {
+        "setup_sched_start": "_reply_sched_start",
+        "setup_sched_stop":  "_reply_sched_stop",
+        "setup_daystart":    "_reply_daystart",
+        "setup_daystop":     "_reply_daystop",
+    }
+    _WIZARD_MINUTE_REPLIES = {
+        "setup_simple": "_reply_simple",
+        "setup_edu":    "_reply_edu",
+        "setup_fun":    "_reply_fun",
+    }
+
+
+    def _cached_keyboard(self, key, build) -> InlineKeyboardMarkup:
+        """Return a wizard keyboard, building it on first use.
+
+        Labels only depend on the bot locale, and markups are immutable,
+        so one instance per key is shared across chats and renders.
+        """
+        keyboard = self._wizard_keyboards.get(key)
+        if keyboard is None:
+            keyboard = self._wizard_keyboards[key] = build()
+        return keyboard
+
+    def _set_wizard_step(self, chat_id: int, step: str) -> None:
+        """Move the wizard to a custom-input step, keeping profile and onboard state."""
+        self._pending_wizard.setdefault(chat_id, {})["step"] = step
+
+    async def _prompt_custom_input(self, query, step: str, prompt: str, markdown: bool = False) -> None:
+        """Switch the wizard to a text-entry step and ask for the value.
 
+        The step is recorded before any network call so a quick reply can't
+        outrun it; the in-place edit and the ForceReply prompt go out together.
+        """
+        self._set_wizard_step(query.message.chat_id, step)
+        await asyncio.gather(
+            _edit_msg(query, _md_cached(prompt)),
+            self._send_reply_prompt(query.message, prompt, markdown=markdown),
+        )
 
     def _wizard_store(self, chat_id: int) -> 'ChildStore':
         """Get the ChildStore for an active wizard, based on stored profile_id."""
-        state = self._pending_wizard.get(chat_id, {})
-        pid = state.get("profile_id", "default")
-        return self._child_store(pid)
+        state = self._pending_wizard.get(chat_id)
+        return self._child_store(state.get("profile_id", "default") if state else "default")
 
     def _get_tz(self) -> str:
         """Return the configured timezone string (or empty for UTC)."""
@@ -98,11 +168,7 @@ class TimeLimitMixin:
     def _has_any_day_overrides(self, store=None) -> bool:
         """Check if any per-day overrides exist."""
         s = store or self.video_store
-        for day in DAY_NAMES:
-            for key in self._OVERRIDE_KEYS:
-                if s.get_setting(f"{day}_{key}", ""):
-                    return True
-        return False
+        return s.has_any_setting(self._DAY_OVERRIDE_KEYS)
 
     def _get_day_overrides(self, day: str, store=None) -> dict[str, str]:
         """Get all override settings for a specific day."""
@@ -141,12 +207,50 @@ class TimeLimitMixin:
         new_mode='category': clears daily flat limit.
         """
         s = store or self.video_store
+        s.set_settings(self._mode_clear_values(new_mode, day))
+
+    @staticmethod
+    def _mode_clear_values(new_mode: str, day: str = "") -> dict[str, str]:
+        """Settings that _auto_clear_mode resets for new_mode (empty for unknown modes)."""
         prefix = f"{day}_" if day else ""
         if new_mode == "simple":
-            s.set_setting(f"{prefix}edu_limit_minutes", "0")
-            s.set_setting(f"{prefix}fun_limit_minutes", "0")
-        elif new_mode == "category":
-            s.set_setting(f"{prefix}daily_limit_minutes", "0")
+            return {f"{prefix}edu_limit_minutes": "0", f"{prefix}fun_limit_minutes": "0"}
+        if new_mode == "category":
+            return {f"{prefix}daily_limit_minutes": "0"}
+        return {}
+
+    async def _wizard_write(self, ws, values: dict[str, str]) -> None:
+        """Persist wizard settings in a worker thread so SQLite never blocks the event loop.
+
+        Callers run under the chat's wizard lock, which keeps one admin's writes
+        in order while other chats proceed.
+        """
+        await asyncio.to_thread(ws.set_settings, values)
+
+    def _wizard_lock(self, chat_id: int) -> asyncio.Lock:
+        """Per-chat lock serializing time-wizard steps (button taps and text replies)."""
+        lock = self._wizard_locks.get(chat_id)
+        if lock is None:
+            lock = self._wizard_locks[chat_id] = asyncio.Lock()
+        return lock
+
+    async def _run_wizard_callback(self, query, step) -> None:
+        """Run a wizard button callback under the chat lock, dropping double taps.
+
+        A tap on the same button of the same message while the first one is
+        still being handled is ignored, rather than repeating the settings
+        write and an edit Telegram would reject as "message is not modified".
+        """
+        chat_id = query.message.chat_id
+        tap = (chat_id, query.message.message_id, query.data)
+        if tap in self._wizard_taps:
+            return
+        self._wizard_taps.add(tap)
+        try:
+            async with self._wizard_lock(chat_id):
+                await step()
+        finally:
+            self._wizard_taps.discard(tap)
 
     async def _cmd_timelimit(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         if not self._check_admin(update):
@@ -746,10 +850,11 @@ class TimeLimitMixin:
     async def _time_add_bonus(self, update: Update, args: list[str], store=None) -> None:
         """Handle /time add <minutes> — grant bonus screen time for today only."""
         s = store or self.video_store
-        if not args or not args[0].isdigit():
+        try:
+            add_min = int(args[0])
+        except (IndexError, ValueError):
             await update.effective_message.reply_text(self.tr("Usage: /time add <minutes>"))
             return
-        add_min = int(args[0])
         if add_min <= 0:
             await update.effective_message.reply_text(self.tr("Bonus minutes must be a positive number."))
             return
@@ -783,50 +888,50 @@ class TimeLimitMixin:
 
     def _render_setup_top(self, onboard: bool = False) -> tuple[str, InlineKeyboardMarkup]:
         """Build the top-level Limits / Schedule menu."""
-        text = _md(
+        text = _md_cached(
             f"\u23f0 **{self.tr('Time Setup')}**\n\n"
             f"{self.tr('What would you like to configure?')}\n\n"
             f"**{self.tr('Limits')}** \u2014 {self.tr('daily screen time budgets')}\n"
             f"**{self.tr('Schedule')}** \u2014 {self.tr('when videos are available')}"
         )
-        rows = [[
-            InlineKeyboardButton(self.tr("Limits"), callback_data="setup_top:limits"),
-            InlineKeyboardButton(self.tr("Schedule"), callback_data="setup_top:schedule"),
-        ]]
-        if onboard:
-            rows.append([InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="onboard_time_back")])
-        else:
-            rows.append([InlineKeyboardButton(f"\u2705 {self.tr('Done')}", callback_data="setup_done")])
-        keyboard = InlineKeyboardMarkup(rows)
+        keyboard = self._cached_keyboard(("setup_top", onboard), lambda: InlineKeyboardMarkup([
+            [
+                InlineKeyboardButton(self.tr("Limits"), callback_data="setup_top:limits"),
+                InlineKeyboardButton(self.tr("Schedule"), callback_data="setup_top:schedule"),
+            ],
+            [InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="onboard_time_back")]
+            if onboard else
+            [InlineKeyboardButton(f"\u2705 {self.tr('Done')}", callback_data="setup_done")],
+        ]))
         return text, keyboard
 
     def _render_setup_mode(self) -> tuple[str, InlineKeyboardMarkup]:
         """Build the Simple / Category mode choice."""
-        text = _md(
+        text = _md_cached(
             f"\u23f0 **{self.tr('Time Limit Setup')}**\n\n"
             f"{self.tr('How would you like to manage screen time?')}\n\n"
             f"**{self.tr('Simple')}** \u2014 {self.tr('one daily cap for all videos.')}\n"
             f"**{self.tr('Category')}** \u2014 {self.tr('separate edu + fun budgets (total = edu + fun).')}"
         )
-        keyboard = InlineKeyboardMarkup([
+        keyboard = self._cached_keyboard("setup_mode", lambda: InlineKeyboardMarkup([
             [
                 InlineKeyboardButton(self.tr("Simple Limit"), callback_data="setup_mode:simple"),
                 InlineKeyboardButton(self.tr("Category Limits"), callback_data="setup_mode:category"),
             ],
             [InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="setup_back:top")],
-        ])
+        ]))
         return text, keyboard
 
     def _render_setup_sched_apply(self) -> tuple[str, InlineKeyboardMarkup]:
         """Build the Same for all / Customize by day choice."""
-        text = _md(self.tr("Same schedule every day, or different times for specific days?"))
-        keyboard = InlineKeyboardMarkup([
+        text = _md_cached(self.tr("Same schedule every day, or different times for specific days?"))
+        keyboard = self._cached_keyboard("sched_apply", lambda: InlineKeyboardMarkup([
             [
                 InlineKeyboardButton(self.tr("Same for all days"), callback_data="setup_sched_apply:all"),
                 InlineKeyboardButton(self.tr("Customize by day"), callback_data="setup_sched_apply:custom"),
             ],
             [InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="setup_back:top")],
-        ])
+        ]))
         return text, keyboard
 
     async def _cb_setup_top(self, query, choice: str) -> None:
@@ -880,41 +985,47 @@ class TimeLimitMixin:
 
     async def _setup_sched_start_menu(self, query, prefix: str = "setup_sched_start") -> None:
         """Show start-time presets."""
-        text = _md(self.tr("Set when watching is allowed to begin:"))
-        keyboard = InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton(self.fmt_time("07:00"), callback_data=f"{prefix}:07:00"),
-                InlineKeyboardButton(self.fmt_time("08:00"), callback_data=f"{prefix}:08:00"),
-                InlineKeyboardButton(self.fmt_time("09:00"), callback_data=f"{prefix}:09:00"),
-                InlineKeyboardButton(self.tr("Custom"), callback_data=f"{prefix}:custom"),
-            ],
-            [InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="setup_back:sched_apply")],
-        ])
+        text = _md_cached(self.tr("Set when watching is allowed to begin:"))
+        keyboard = self._time_preset_keyboard(prefix, _START_PRESETS, back="sched_apply")
         await _edit_msg(query, text, keyboard)
 
     async def _setup_sched_stop_menu(self, query, start_display: str,
                                      prefix: str = "setup_sched_stop") -> None:
         """Show stop-time presets."""
-        text = _md(
-            self.tr("Start: {time} ✓\nNow set when watching must stop:", time=start_display)
-        )
-        keyboard = InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton(self.fmt_time("19:00"), callback_data=f"{prefix}:19:00"),
-                InlineKeyboardButton(self.fmt_time("20:00"), callback_data=f"{prefix}:20:00"),
-                InlineKeyboardButton(self.fmt_time("21:00"), callback_data=f"{prefix}:21:00"),
-                InlineKeyboardButton(self.tr("Custom"), callback_data=f"{prefix}:custom"),
-            ],
-            [InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="setup_back:sched_start")],
-        ])
+        text = self._stop_prompt(start_display)
+        keyboard = self._time_preset_keyboard(prefix, _STOP_PRESETS, back="sched_start")
         await _edit_msg(query, text, keyboard)
 
+    def _stop_prompt(self, start_display: str, day_label: str = "") -> str:
+        """Confirm the chosen start time and ask for the stop time (default or one day)."""
+        if day_label:
+            return _md(self.tr("{label} start: {time} ✓\nSet stop time for {label}:",
+                               label=day_label, time=start_display))
+        return _md(self.tr("Start: {time} ✓\nNow set when watching must stop:", time=start_display))
+
+    def _time_preset_keyboard(self, prefix: str, presets: tuple[str, ...],
+                              back: str | None = None) -> InlineKeyboardMarkup:
+        """Time preset buttons plus Custom, with an optional Back row (setup_back:<back>).
+
+        Shared by every start/stop picker; callback data is "{prefix}:{HH:MM}".
+        """
+        def build():
+            rows = [[
+                *(InlineKeyboardButton(self.fmt_time(hhmm), callback_data=f"{prefix}:{hhmm}") for hhmm in presets),
+                InlineKeyboardButton(self.tr("Custom"), callback_data=f"{prefix}:custom"),
+            ]]
+            if back:
+                rows.append([InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data=f"setup_back:{back}")])
+            return InlineKeyboardMarkup(rows)
+        return self._cached_keyboard(("time_presets", prefix, presets, back), build)
+
     def _setup_sched_day_grid(self, store=None) -> tuple[str, InlineKeyboardMarkup]:
         """Build day-grid text and keyboard."""
         s = store or self.video_store
+        sched = s.get_settings(self._SCHEDULE_KEYS)
         # Show default schedule if set
-        start = s.get_setting("schedule_start", "")
-        end = s.get_setting("schedule_end", "")
+        start = sched.get("schedule_start", "")
+        end = sched.get("schedule_end", "")
         if start or end:
             start_disp = self.fmt_time(start) if start else self.tr("not set")
             end_disp = self.fmt_time(end) if end else self.tr("not set")
@@ -924,27 +1035,32 @@ class TimeLimitMixin:
         text = _md(
             f"{header}{self.tr('Tap a day to set its schedule, or Done to finish.')}"
         )
-        # Build day buttons, mark overrides with bullet
-        row1, row2 = [], []
-        for day in DAY_NAMES:
-            has_override = (
-                s.get_setting(f"{day}_schedule_start", "") or
-                s.get_setting(f"{day}_schedule_end", "")
-            )
+        # Bit i set = DAY_NAMES[i] has its own schedule; the keyboard only depends on this mask
+        bits = 0
+        for i, day in enumerate(DAY_NAMES):
+            if sched.get(f"{day}_schedule_start") or sched.get(f"{day}_schedule_end"):
+                bits |= 1 << i
+        keyboard = self._cached_keyboard(("day_grid", bits), lambda: self._build_day_grid_keyboard(bits))
+        return text, keyboard
+
+    def _build_day_grid_keyboard(self, override_bits: int) -> InlineKeyboardMarkup:
+        """Build day-grid buttons, marking days whose bit is set with a bullet."""
+        def btn(i: int, day: str) -> InlineKeyboardButton:
             label = self.day_label(day, short=True)
-            if has_override:
+            if override_bits & (1 << i):
                 label += " \u2022"
-            btn = InlineKeyboardButton(label, callback_data=f"setup_sched_day:{day}")
-            if day in ("mon", "tue", "wed", "thu"):
-                row1.append(btn)
-            else:
-                row2.append(btn)
+            return InlineKeyboardButton(label, callback_data=f"setup_sched_day:{day}")
+
+        offset = len(_DAY_GRID_ROWS[0])
+        rows = (
+            [btn(i, day) for i, day in enumerate(_DAY_GRID_ROWS[0])],
+            [btn(i, day) for i, day in enumerate(_DAY_GRID_ROWS[1], offset)],
+        )
         bottom_row = [
             InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="setup_back:sched_apply"),
             InlineKeyboardButton(self.tr("Done ✓"), callback_data="setup_sched_done"),
         ]
-        keyboard = InlineKeyboardMarkup([row1, row2, bottom_row])
-        return text, keyboard
+        return InlineKeyboardMarkup([*rows, bottom_row])
 
     async def _cb_setup_sched_start(self, query, value: str) -> None:
         """Handle default start-time selection."""
@@ -952,16 +1068,9 @@ class TimeLimitMixin:
         ws = self._wizard_store(chat_id)
         if value == "custom":
             prompt = self.tr("Reply with the start time (e.g. 8am, 08:00):")
-            await _edit_msg(query, _md(prompt))
-            await self._send_reply_prompt(query.message, prompt)
-            state = self._pending_wizard.get(chat_id, {})
-            pid = state.get("profile_id", "default")
-            new_state = {"step": "setup_sched_start", "profile_id": pid}
-            if state.get("onboard_return"):
-                new_state["onboard_return"] = True
-            self._pending_wizard[chat_id] = new_state
+            await self._prompt_custom_input(query, "setup_sched_start", prompt)
             return
-        ws.set_setting("schedule_start", value)
+        await self._wizard_write(ws, {"schedule_start": value})
         await self._setup_sched_stop_menu(query, self.fmt_time(value))
 
     async def _cb_setup_sched_stop(self, query, value: str) -> None:
@@ -970,16 +1079,9 @@ class TimeLimitMixin:
         ws = self._wizard_store(chat_id)
         if value == "custom":
             prompt = self.tr("Reply with the stop time (e.g. 8pm, 20:00):")
-            await _edit_msg(query, _md(prompt))
-            await self._send_reply_prompt(query.message, prompt)
-            state = self._pending_wizard.get(chat_id, {})
-            pid = state.get("profile_id", "default")
-            new_state = {"step": "setup_sched_stop", "profile_id": pid}
-            if state.get("onboard_return"):
-                new_state["onboard_return"] = True
-            self._pending_wizard[chat_id] = new_state
+            await self._prompt_custom_input(query, "setup_sched_stop", prompt)
             return
-        ws.set_setting("schedule_end", value)
+        await self._wizard_write(ws, {"schedule_end": value})
         await self._cb_setup_sched_done(query)
 
     async def _cb_setup_sched_apply(self, query, choice: str) -> None:
@@ -997,15 +1099,17 @@ class TimeLimitMixin:
             return
         ws = self._wizard_store(query.message.chat_id)
         label = self.day_label(day)
-        start = self._effective_setting(day, "schedule_start", store=ws)
-        end = self._effective_setting(day, "schedule_end", store=ws)
+        sched = ws.get_settings([
+            "schedule_start", "schedule_end", f"{day}_schedule_start", f"{day}_schedule_end",
+        ])
+        day_start = sched.get(f"{day}_schedule_start", "")
+        day_end = sched.get(f"{day}_schedule_end", "")
+        start = day_start or sched.get("schedule_start", "")
+        end = day_end or sched.get("schedule_end", "")
         start_disp = self.fmt_time(start) if start else self.tr("not set")
         end_disp = self.fmt_time(end) if end else self.tr("not set")
         # Check if this day has its own overrides
-        has_own = (
-            ws.get_setting(f"{day}_schedule_start", "") or
-            ws.get_setting(f"{day}_schedule_end", "")
-        )
+        has_own = day_start or day_end
         source = "" if has_own else " (default)"
         text = _md(
             self.tr(
@@ -1017,15 +1121,7 @@ class TimeLimitMixin:
             )
         )
         # Offer presets near the current default
-        keyboard = InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton(self.fmt_time("08:00"), callback_data=f"setup_daystart:{day}:08:00"),
-                InlineKeyboardButton(self.fmt_time("09:00"), callback_data=f"setup_daystart:{day}:09:00"),
-                InlineKeyboardButton(self.fmt_time("10:00"), callback_data=f"setup_daystart:{day}:10:00"),
-                InlineKeyboardButton(self.tr("Custom"), callback_data=f"setup_daystart:{day}:custom"),
-            ],
-            [InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="setup_back:day_grid")],
-        ])
+        keyboard = self._time_preset_keyboard(f"setup_daystart:{day}", _DAY_START_PRESETS, back="day_grid")
         await _edit_msg(query, text, keyboard)
 
     async def _cb_setup_daystart(self, query, day: str, value: str) -> None:
@@ -1037,29 +1133,11 @@ class TimeLimitMixin:
         if value == "custom":
             label = self.day_label(day)
             prompt = self.tr("Reply with start time for {label} (e.g. 9am, 09:00):", label=label)
-            await _edit_msg(query, _md(prompt))
-            await self._send_reply_prompt(query.message, prompt)
-            state = self._pending_wizard.get(chat_id, {})
-            pid = state.get("profile_id", "default")
-            new_state = {"step": f"setup_daystart:{day}", "profile_id": pid}
-            if state.get("onboard_return"):
-                new_state["onboard_return"] = True
-            self._pending_wizard[chat_id] = new_state
+            await self._prompt_custom_input(query, f"setup_daystart:{day}", prompt)
             return
-        ws.set_setting(f"{day}_schedule_start", value)
-        label = self.day_label(day)
-        text = _md(
-            self.tr("{label} start: {time} ✓\nSet stop time for {label}:", label=label, time=self.fmt_time(value))
-        )
-        keyboard = InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton(self.fmt_time("20:00"), callback_data=f"setup_daystop:{day}:20:00"),
-                InlineKeyboardButton(self.fmt_time("21:00"), callback_data=f"setup_daystop:{day}:21:00"),
-                InlineKeyboardButton(self.fmt_time("22:00"), callback_data=f"setup_daystop:{day}:22:00"),
-                InlineKeyboardButton(self.tr("Custom"), callback_data=f"setup_daystop:{day}:custom"),
-            ],
-            [InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="setup_back:day_grid")],
-        ])
+        await self._wizard_write(ws, {f"{day}_schedule_start": value})
+        text = self._stop_prompt(self.fmt_time(value), self.day_label(day))
+        keyboard = self._time_preset_keyboard(f"setup_daystop:{day}", _DAY_STOP_PRESETS, back="day_grid")
         await _edit_msg(query, text, keyboard)
 
     async def _cb_setup_daystop(self, query, day: str, value: str) -> None:
@@ -1071,16 +1149,9 @@ class TimeLimitMixin:
         if value == "custom":
             label = self.day_label(day)
             prompt = self.tr("Reply with stop time for {label} (e.g. 9pm, 21:00):", label=label)
-            await _edit_msg(query, _md(prompt))
-            await self._send_reply_prompt(query.message, prompt)
-            state = self._pending_wizard.get(chat_id, {})
-            pid = state.get("profile_id", "default")
-            new_state = {"step": f"setup_daystop:{day}", "profile_id": pid}
-            if state.get("onboard_return"):
-                new_state["onboard_return"] = True
-            self._pending_wizard[chat_id] = new_state
+            await self._prompt_custom_input(query, f"setup_daystop:{day}", prompt)
             return
-        ws.set_setting(f"{day}_schedule_end", value)
+        await self._wizard_write(ws, {f"{day}_schedule_end": value})
         text, keyboard = self._setup_sched_day_grid(store=ws)
         await _edit_msg(query, text, keyboard)
 
@@ -1088,36 +1159,38 @@ class TimeLimitMixin:
         """Final summary when schedule wizard completes."""
         chat_id = query.message.chat_id
         ws = self._wizard_store(chat_id)
-        start = ws.get_setting("schedule_start", "")
-        end = ws.get_setting("schedule_end", "")
-        start_disp = self.fmt_time(start) if start else self.tr("not set")
-        end_disp = self.fmt_time(end) if end else self.tr("not set")
+        sched = ws.get_settings(self._SCHEDULE_KEYS)
+        start = sched.get("schedule_start", "")
+        end = sched.get("schedule_end", "")
+        fmt_time, day_label = self.fmt_time, self.day_label
+        start_disp = fmt_time(start) if start else self.tr("not set")
+        end_disp = fmt_time(end) if end else self.tr("not set")
         lines = [
             self.tr("✓ **Schedule configured**\n"),
             self.tr("Default: {start} – {end}", start=start_disp, end=end_disp),
         ]
         # List per-day overrides
         for day in DAY_NAMES:
-            ds = ws.get_setting(f"{day}_schedule_start", "")
-            de = ws.get_setting(f"{day}_schedule_end", "")
+            ds = sched.get(f"{day}_schedule_start", "")
+            de = sched.get(f"{day}_schedule_end", "")
             if ds or de:
-                label = self.day_label(day, short=True)
-                ds_disp = self.fmt_time(ds) if ds else start_disp
-                de_disp = self.fmt_time(de) if de else end_disp
+                label = day_label(day, short=True)
+                ds_disp = fmt_time(ds) if ds else start_disp
+                de_disp = fmt_time(de) if de else end_disp
                 lines.append(f"{label}: {ds_disp} \u2013 {de_disp}")
         lines.append(self.tr("\nUse `/time <day> start|stop` to adjust later."))
-        await _edit_msg(query, _md("\n".join(lines)))
-        await self._maybe_onboard_return(chat_id)
+        text, markup = self._with_onboard_return(_md("\n".join(lines)), self._pop_onboard_return(chat_id))
+        await _edit_msg(query, text, markup)
 
     def _render_setup_edu(self) -> tuple[str, InlineKeyboardMarkup]:
         """Build the edu preset picker."""
-        text = _md(
+        text = _md_cached(
             self.tr(
                 "Category mode gives separate budgets for educational and entertainment videos. "
                 "Total screen time = edu + fun.\n\nSet **educational** limit:"
             )
         )
-        keyboard = InlineKeyboardMarkup([
+        keyboard = self._cached_keyboard("edu_presets", lambda: InlineKeyboardMarkup([
             [
                 InlineKeyboardButton("60 min", callback_data="setup_edu:60"),
                 InlineKeyboardButton("90 min", callback_data="setup_edu:90"),
@@ -1125,17 +1198,29 @@ class TimeLimitMixin:
                 InlineKeyboardButton(self.tr("Custom"), callback_data="setup_edu:custom"),
             ],
             [InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="setup_back:mode")],
-        ])
+        ]))
         return text, keyboard
 
+    def _fun_presets_keyboard(self) -> InlineKeyboardMarkup:
+        """Build the fun preset picker shown after the edu limit is set."""
+        return self._cached_keyboard("fun_presets", lambda: InlineKeyboardMarkup([
+            [
+                InlineKeyboardButton("30 min", callback_data="setup_fun:30"),
+                InlineKeyboardButton("60 min", callback_data="setup_fun:60"),
+                InlineKeyboardButton("90 min", callback_data="setup_fun:90"),
+                InlineKeyboardButton(self.tr("Custom"), callback_data="setup_fun:custom"),
+            ],
+            [InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="setup_back:edu")],
+        ]))
+
     async def _cb_setup_mode(self, query, mode: str) -> None:
         """Handle mode choice from wizard."""
         if mode == "simple":
-            text = _md(self.tr(
+            text = _md_cached(self.tr(
                 "Set a daily screen time limit. All videos share one pool.\n\n"
                 "Pick a preset or reply with a custom number:"
             ))
-            keyboard = InlineKeyboardMarkup([
+            keyboard = self._cached_keyboard("simple_presets", lambda: InlineKeyboardMarkup([
                 [
                     InlineKeyboardButton("60 min", callback_data="setup_simple:60"),
                     InlineKeyboardButton("90 min", callback_data="setup_simple:90"),
@@ -1143,7 +1228,7 @@ class TimeLimitMixin:
                     InlineKeyboardButton(self.tr("Custom"), callback_data="setup_simple:custom"),
                 ],
                 [InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="setup_back:mode")],
-            ])
+            ]))
             await _edit_msg(query, text, keyboard)
         elif mode == "category":
             text, keyboard = self._render_setup_edu()
@@ -1155,19 +1240,12 @@ class TimeLimitMixin:
         ws = self._wizard_store(chat_id)
         if value == "custom":
             prompt = self.tr("Reply with the number of minutes:")
-            await _edit_msg(query, prompt)
-            await self._send_reply_prompt(query.message, prompt)
-            state = self._pending_wizard.get(chat_id, {})
-            pid = state.get("profile_id", "default")
-            onboard = state.get("onboard_return", False)
-            new_state = {"step": "setup_simple", "profile_id": pid}
-            if onboard:
-                new_state["onboard_return"] = True
-            self._pending_wizard[chat_id] = new_state
+            await self._prompt_custom_input(query, "setup_simple", prompt)
             return
         minutes = int(value)
-        ws.set_setting("daily_limit_minutes", str(minutes))
-        self._auto_clear_mode("simple", store=ws)
+        await self._wizard_write(ws, {
+            "daily_limit_minutes": str(minutes), **self._mode_clear_values("simple"),
+        })
         text = _md(
             self.tr(
                 "✓ **Simple limit set**\n"
@@ -1176,8 +1254,8 @@ class TimeLimitMixin:
                 minutes=minutes,
             )
         )
-        await _edit_msg(query, text)
-        await self._maybe_onboard_return(chat_id)
+        text, markup = self._with_onboard_return(text, self._pop_onboard_return(chat_id))
+        await _edit_msg(query, text, markup)
 
     async def _cb_setup_edu(self, query, value: str) -> None:
         """Handle edu limit selection in wizard."""
@@ -1185,32 +1263,16 @@ class TimeLimitMixin:
         ws = self._wizard_store(chat_id)
         if value == "custom":
             prompt = self.tr("Reply with the number of minutes for **educational** limit:")
-            await _edit_msg(query, _md(prompt))
-            await self._send_reply_prompt(query.message, prompt, markdown=True)
-            state = self._pending_wizard.get(chat_id, {})
-            pid = state.get("profile_id", "default")
-            onboard = state.get("onboard_return", False)
-            new_state = {"step": "setup_edu", "profile_id": pid}
-            if onboard:
-                new_state["onboard_return"] = True
-            self._pending_wizard[chat_id] = new_state
+            await self._prompt_custom_input(query, "setup_edu", prompt, markdown=True)
             return
         minutes = int(value)
-        ws.set_setting("edu_limit_minutes", str(minutes))
-        self._auto_clear_mode("category", store=ws)
+        await self._wizard_write(ws, {
+            "edu_limit_minutes": str(minutes), **self._mode_clear_values("category"),
+        })
         text = _md(
             self.tr("Educational: {minutes} min ✓\nNow set **entertainment** limit:", minutes=minutes)
         )
-        keyboard = InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton("30 min", callback_data="setup_fun:30"),
-                InlineKeyboardButton("60 min", callback_data="setup_fun:60"),
-                InlineKeyboardButton("90 min", callback_data="setup_fun:90"),
-                InlineKeyboardButton(self.tr("Custom"), callback_data="setup_fun:custom"),
-            ],
-            [InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="setup_back:edu")],
-        ])
-        await _edit_msg(query, text, keyboard)
+        await _edit_msg(query, text, self._fun_presets_keyboard())
 
     async def _cb_setup_fun(self, query, value: str) -> None:
         """Handle fun limit selection in wizard."""
@@ -1218,19 +1280,12 @@ class TimeLimitMixin:
         ws = self._wizard_store(chat_id)
         if value == "custom":
             prompt = self.tr("Reply with the number of minutes for **entertainment** limit:")
-            await _edit_msg(query, _md(prompt))
-            await self._send_reply_prompt(query.message, prompt, markdown=True)
-            state = self._pending_wizard.get(chat_id, {})
-            pid = state.get("profile_id", "default")
-            onboard = state.get("onboard_return", False)
-            new_state = {"step": "setup_fun", "profile_id": pid}
-            if onboard:
-                new_state["onboard_return"] = True
-            self._pending_wizard[chat_id] = new_state
+            await self._prompt_custom_input(query, "setup_fun", prompt, markdown=True)
             return
         minutes = int(value)
-        ws.set_setting("fun_limit_minutes", str(minutes))
-        self._auto_clear_mode("category", store=ws)
+        await self._wizard_write(ws, {
+            "fun_limit_minutes": str(minutes), **self._mode_clear_values("category"),
+        })
         edu = int(ws.get_setting("edu_limit_minutes", "0") or "0")
         total = edu + minutes
         text = _md(
@@ -1245,8 +1300,8 @@ class TimeLimitMixin:
                 total=total,
             )
         )
-        await _edit_msg(query, text)
-        await self._maybe_onboard_return(chat_id)
+        text, markup = self._with_onboard_return(text, self._pop_onboard_return(chat_id))
+        await _edit_msg(query, text, markup)
 
     async def _cb_switch_confirm(self, query, choice: str) -> None:
         """Handle mode switch confirmation callback."""
@@ -1255,26 +1310,25 @@ class TimeLimitMixin:
                 await query.edit_message_reply_markup(reply_markup=None)
             except Exception:
                 pass
-            await _edit_msg(query, self.tr("Keeping current settings."))
+            await _edit_msg(query, self.tr("Keeping current settings."), markdown=False)
             return
 
-        parts = choice.split(":")
-        # Format: {pid}:simple:{minutes} or {pid}:category:{cat}:{minutes}
-        if len(parts) >= 3 and parts[1] == "simple" and parts[2].isdigit():
-            pid = parts[0]
+        simple = _SWITCH_SIMPLE_RE.fullmatch(choice)
+        by_category = None if simple else _SWITCH_CATEGORY_RE.fullmatch(choice)
+        if simple:
+            pid, minutes = simple.group(1), int(simple.group(2))
             ws = self._child_store(pid)
-            minutes = int(parts[2])
-            ws.set_setting("daily_limit_minutes", str(minutes))
-            self._auto_clear_mode("simple", store=ws)
-            text = _md(self.tr("✓ Switched to simple limit: {minutes} min/day", minutes=minutes))
-            await _edit_msg(query, text)
-        elif len(parts) >= 4 and parts[1] == "category" and parts[3].isdigit():
-            pid = parts[0]
+            await self._wizard_write(ws, {
+                "daily_limit_minutes": str(minutes), **self._mode_clear_values("simple"),
+            })
+            text = self.tr("✓ Switched to simple limit: {minutes} min/day", minutes=minutes)
+            await _edit_msg(query, text, markdown=False)
+        elif by_category:
+            pid, category, minutes = by_category.group(1), by_category.group(2), int(by_category.group(3))
             ws = self._child_store(pid)
-            category = parts[2]
-            minutes = int(parts[3])
-            ws.set_setting(f"{category}_limit_minutes", str(minutes))
-            self._auto_clear_mode("category", store=ws)
+            await self._wizard_write(ws, {
+                f"{category}_limit_minutes": str(minutes), **self._mode_clear_values("category"),
+            })
             cat_label = self.cat_label(category)
             other = "fun" if category == "edu" else "edu"
             other_label = self.tr("Entertainment") if category == "edu" else self.tr("Educational")
@@ -1309,119 +1363,112 @@ class TimeLimitMixin:
             # — ignore text input, these steps expect button presses only
             return
 
-        text = update.message.text.strip()
-        ws = self._wizard_store(chat_id)
-
-        # Schedule wizard steps expect time input, not minutes
-        if step.startswith("setup_sched_") or step.startswith("setup_daystart:") or step.startswith("setup_daystop:"):
-            parsed = parse_time_input(text)
-            if not parsed:
+        # Dispatch on the step kind; per-day steps carry the day after ':'
+        kind, _, arg = step.partition(":")
+        handler_name = self._WIZARD_TIME_REPLIES.get(kind)
+        if handler_name:
+            # Schedule wizard steps expect time input, not minutes
+            value = parse_time_input(update.message.text)
+            if not value:
                 await update.effective_message.reply_text(
                     self.tr("Invalid time. Examples: 800am, 8:00, 2000, 8:00PM")
                 )
                 return
-            onboard = state.get("onboard_return", False)
-            del self._pending_wizard[chat_id]
-
-            if step == "setup_sched_start":
-                ws.set_setting("schedule_start", parsed)
-                # Show stop-time picker (as new message since we can't edit)
-                stop_text = _md(
-                    self.tr("Start: {time} ✓\nNow set when watching must stop:", time=self.fmt_time(parsed))
-                )
-                keyboard = InlineKeyboardMarkup([[
-                    InlineKeyboardButton(self.fmt_time("19:00"), callback_data="setup_sched_stop:19:00"),
-                    InlineKeyboardButton(self.fmt_time("20:00"), callback_data="setup_sched_stop:20:00"),
-                    InlineKeyboardButton(self.fmt_time("21:00"), callback_data="setup_sched_stop:21:00"),
-                    InlineKeyboardButton(self.tr("Custom"), callback_data="setup_sched_stop:custom"),
-                ]])
-                await update.effective_message.reply_text(stop_text, parse_mode=MD2, reply_markup=keyboard)
-            elif step == "setup_sched_stop":
-                ws.set_setting("schedule_end", parsed)
-                start = ws.get_setting("schedule_start", "")
-                start_disp = self.fmt_time(start) if start else self.tr("not set")
-                end_disp = self.fmt_time(parsed)
-                lines = [
-                    self.tr("✓ **Schedule configured**\n"),
-                    self.tr("Default: {start} – {end}", start=start_disp, end=end_disp),
-                    self.tr("\nUse `/time <day> start|stop` to adjust later."),
-                ]
-                await update.effective_message.reply_text(_md("\n".join(lines)), parse_mode=MD2)
-                if onboard:
-                    await self._send_onboard_time_return(chat_id)
-            elif step.startswith("setup_daystart:"):
-                day = step.split(":", 1)[1]
-                ws.set_setting(f"{day}_schedule_start", parsed)
-                label = self.day_label(day)
-                stop_text = _md(
-                    self.tr("{label} start: {time} ✓\nSet stop time for {label}:", label=label, time=self.fmt_time(parsed))
-                )
-                keyboard = InlineKeyboardMarkup([[
-                    InlineKeyboardButton(self.fmt_time("20:00"), callback_data=f"setup_daystop:{day}:20:00"),
-                    InlineKeyboardButton(self.fmt_time("21:00"), callback_data=f"setup_daystop:{day}:21:00"),
-                    InlineKeyboardButton(self.fmt_time("22:00"), callback_data=f"setup_daystop:{day}:22:00"),
-                    InlineKeyboardButton(self.tr("Custom"), callback_data=f"setup_daystop:{day}:custom"),
-                ]])
-                await update.effective_message.reply_text(stop_text, parse_mode=MD2, reply_markup=keyboard)
-            elif step.startswith("setup_daystop:"):
-                day = step.split(":", 1)[1]
-                ws.set_setting(f"{day}_schedule_end", parsed)
-                grid_text, keyboard = self._setup_sched_day_grid(store=ws)
-                await update.effective_message.reply_text(grid_text, parse_mode=MD2, reply_markup=keyboard)
-            return
+        else:
+            handler_name = self._WIZARD_MINUTE_REPLIES.get(kind)
+            if not handler_name:
+                return  # Step expects a button press, not text
+            # Limit wizard steps expect positive integer minutes
+            try:
+                value = int(update.message.text.strip())
+            except ValueError:
+                value = 0
+            if value <= 0:
+                await update.effective_message.reply_text(self.tr("Please reply with a positive number of minutes."))
+                return
 
-        # Limit wizard steps expect positive integer minutes
-        if not text.isdigit() or int(text) <= 0:
-            await update.effective_message.reply_text(self.tr("Please reply with a positive number of minutes."))
-            return
+        ws = self._wizard_store(chat_id)
         onboard = state.get("onboard_return", False)
-        minutes = int(text)
         del self._pending_wizard[chat_id]
+        async with self._wizard_lock(chat_id):
+            await getattr(self, handler_name)(update, ws, arg, value, onboard)
+
+    async def _reply_sched_start(self, update: Update, ws, arg: str, parsed: str, onboard: bool) -> None:
+        """Save custom default start time and offer stop-time presets."""
+        await self._wizard_write(ws, {"schedule_start": parsed})
+        # Show stop-time picker (as new message since we can't edit)
+        stop_text = self._stop_prompt(self.fmt_time(parsed))
+        keyboard = self._time_preset_keyboard("setup_sched_stop", _STOP_PRESETS)
+        await update.effective_message.reply_text(stop_text, parse_mode=MD2, reply_markup=keyboard)
+
+    async def _reply_sched_stop(self, update: Update, ws, arg: str, parsed: str, onboard: bool) -> None:
+        """Save custom default stop time and show the schedule summary."""
+        await self._wizard_write(ws, {"schedule_end": parsed})
+        start = ws.get_setting("schedule_start", "")
+        start_disp = self.fmt_time(start) if start else self.tr("not set")
+        end_disp = self.fmt_time(parsed)
+        lines = [
+            self.tr("✓ **Schedule configured**\n"),
+            self.tr("Default: {start} – {end}", start=start_disp, end=end_disp),
+            self.tr("\nUse `/time <day> start|stop` to adjust later."),
+        ]
+        text, markup = self._with_onboard_return(_md("\n".join(lines)), onboard)
+        await update.effective_message.reply_text(text, parse_mode=MD2, reply_markup=markup)
+
+    async def _reply_daystart(self, update: Update, ws, day: str, parsed: str, onboard: bool) -> None:
+        """Save custom per-day start time and offer stop-time presets."""
+        await self._wizard_write(ws, {f"{day}_schedule_start": parsed})
+        stop_text = self._stop_prompt(self.fmt_time(parsed), self.day_label(day))
+        keyboard = self._time_preset_keyboard(f"setup_daystop:{day}", _DAY_STOP_PRESETS)
+        await update.effective_message.reply_text(stop_text, parse_mode=MD2, reply_markup=keyboard)
+
+    async def _reply_daystop(self, update: Update, ws, day: str, parsed: str, onboard: bool) -> None:
+        """Save custom per-day stop time and return to the day grid."""
+        await self._wizard_write(ws, {f"{day}_schedule_end": parsed})
+        grid_text, keyboard = self._setup_sched_day_grid(store=ws)
+        await update.effective_message.reply_text(grid_text, parse_mode=MD2, reply_markup=keyboard)
+
+    async def _reply_simple(self, update: Update, ws, arg: str, minutes: int, onboard: bool) -> None:
+        """Save custom simple limit."""
+        await self._wizard_write(ws, {
+            "daily_limit_minutes": str(minutes), **self._mode_clear_values("simple"),
+        })
+        text, markup = self._with_onboard_return(_md(
+            self.tr(
+                "✓ **Simple limit set**\n"
+                "  Daily cap: {minutes} min/day\n\n"
+                "Use `/time <day> limit <min>` to customize specific days.",
+                minutes=minutes,
+            )
+        ), onboard)
+        await update.effective_message.reply_text(text, parse_mode=MD2, reply_markup=markup)
+
+    async def _reply_edu(self, update: Update, ws, arg: str, minutes: int, onboard: bool) -> None:
+        """Save custom edu limit and offer fun presets."""
+        await self._wizard_write(ws, {
+            "edu_limit_minutes": str(minutes), **self._mode_clear_values("category"),
+        })
+        await update.effective_message.reply_text(_md(
+            self.tr("Educational: {minutes} min ✓\nNow set **entertainment** limit:", minutes=minutes)
+        ), parse_mode=MD2, reply_markup=self._fun_presets_keyboard())
 
-        if step == "setup_simple":
-            ws.set_setting("daily_limit_minutes", str(minutes))
-            self._auto_clear_mode("simple", store=ws)
-            await update.effective_message.reply_text(_md(
-                self.tr(
-                    "✓ **Simple limit set**\n"
-                    "  Daily cap: {minutes} min/day\n\n"
-                    "Use `/time <day> limit <min>` to customize specific days.",
-                    minutes=minutes,
-                )
-            ), parse_mode=MD2)
-            if onboard:
-                await self._send_onboard_time_return(chat_id)
-        elif step == "setup_edu":
-            ws.set_setting("edu_limit_minutes", str(minutes))
-            self._auto_clear_mode("category", store=ws)
-            keyboard = InlineKeyboardMarkup([
-                [
-                    InlineKeyboardButton("30 min", callback_data="setup_fun:30"),
-                    InlineKeyboardButton("60 min", callback_data="setup_fun:60"),
-                    InlineKeyboardButton("90 min", callback_data="setup_fun:90"),
-                    InlineKeyboardButton(self.tr("Custom"), callback_data="setup_fun:custom"),
-                ],
-                [InlineKeyboardButton(f"\u2190 {self.tr('Back')}", callback_data="setup_back:edu")],
-            ])
-            await update.effective_message.reply_text(_md(
-                self.tr("Educational: {minutes} min ✓\nNow set **entertainment** limit:", minutes=minutes)
-            ), parse_mode=MD2, reply_markup=keyboard)
-        elif step == "setup_fun":
-            ws.set_setting("fun_limit_minutes", str(minutes))
-            self._auto_clear_mode("category", store=ws)
-            edu = int(ws.get_setting("edu_limit_minutes", "0") or "0")
-            total = edu + minutes
-            await update.effective_message.reply_text(_md(
-                self.tr(
-                    "✓ **Category limits set**\n"
-                    "  Educational: {edu} min/day\n"
-                    "  Entertainment: {fun} min/day\n"
-                    "  Total: {total} min/day\n\n"
-                    "Use `/time <day> edu|fun <min>` to customize specific days.",
-                    edu=edu,
-                    fun=minutes,
-                    total=total,
-                )
-            ), parse_mode=MD2)
-            if onboard:
-                await self._send_onboard_time_return(chat_id)
+    async def _reply_fun(self, update: Update, ws, arg: str, minutes: int, onboard: bool) -> None:
+        """Save custom fun limit and show the category summary."""
+        await self._wizard_write(ws, {
+            "fun_limit_minutes": str(minutes), **self._mode_clear_values("category"),
+        })
+        edu = int(ws.get_setting("edu_limit_minutes", "0") or "0")
+        total = edu + minutes
+        text, markup = self._with_onboard_return(_md(
+            self.tr(
+                "✓ **Category limits set**\n"
+                "  Educational: {edu} min/day\n"
+                "  Entertainment: {fun} min/day\n"
+                "  Total: {total} min/day\n\n"
+                "Use `/time <day> edu|fun <min>` to customize specific days.",
+                edu=edu,
+                fun=minutes,
+                total=total,
+            )
+        ), onboard)
+        await update.effective_message.reply_text(text, parse_mode=MD2, reply_markup=markup)
@@ -3,40 +3,78 @@
 import logging
 import os
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
+from zoneinfo import ZoneInfo
 
-import yaml
+from utils import load_yaml
 
 logger = logging.getLogger(__name__)
 
+# ${VAR} or $VAR — matched in one pass so expanded values are never re-scanned
+_ENV_RE = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
+
+
+def _env_repl(m: re.Match) -> str:
+    return os.environ.get(m.group(1) or m.group(2), '')
+
 
 def expand_env_vars(value: Any) -> Any:
     """Recursively expand environment variables in strings, dicts, and lists.
 
-    Supports both ${VAR} and $VAR patterns.
+    Supports both ${VAR} and $VAR patterns. Containers with nothing to
+    expand are returned as-is; a copy is made only along changed paths.
     """
     if isinstance(value, str):
-        # Expand ${VAR} pattern
-        pattern = re.compile(r'\$\{([^}]+)\}')
-        result = pattern.sub(lambda m: os.environ.get(m.group(1), ''), value)
-        # Expand $VAR pattern
-        pattern = re.compile(r'\$([A-Za-z_][A-Za-z0-9_]*)')
-        result = pattern.sub(lambda m: os.environ.get(m.group(1), ''), result)
-        return result
+        if '$' not in value:
+            return value
+        return _ENV_RE.sub(_env_repl, value)
     elif isinstance(value, dict):
-        return {k: expand_env_vars(v) for k, v in value.items()}
+        result = None
+        for k, v in value.items():
+            expanded = expand_env_vars(v)
+            if expanded is not v:
+                if result is None:
+                    result = dict(value)
+                result[k] = expanded
+        return value if result is None else result
     elif isinstance(value, list):
-        return [expand_env_vars(item) for item in value]
+        result = None
+        for i, item in enumerate(value):
+            expanded = expand_env_vars(item)
+            if expanded is not item:
+                if result is None:
+                    result = list(value)
+                result[i] = expanded
+        return value if result is None else result
     else:
         return value
 
 
+def _expand_env_inplace(value: Any) -> Any:
+    """Expand environment variables in a freshly parsed document, in place.
+
+    Dicts and lists are updated rather than copied, so only expanded strings
+    allocate. For documents no one else holds (load_yaml returns a new one
+    per call); use expand_env_vars for anything shared.
+    """
+    if isinstance(value, str):
+        return _ENV_RE.sub(_env_repl, value) if '$' in value else value
+    if isinstance(value, dict):
+        for k, v in value.items():
+            value[k] = _expand_env_inplace(v)
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            value[i] = _expand_env_inplace(item)
+    return value
+
+
 VALID_LOG_LEVELS = {"debug", "info", "warning", "error"}
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Application-wide configuration."""
     locale: str = "en"
@@ -46,11 +84,11 @@ class AppConfig:
     def __post_init__(self):
         self.log_level = self.log_level.lower()
         if self.log_level not in VALID_LOG_LEVELS:
-            logger.warning(f"Invalid log_level '{self.log_level}', defaulting to 'info'")
+            logger.warning("Invalid log_level '%s', defaulting to 'info'", self.log_level)
             self.log_level = "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class WebConfig:
     """Web server configuration."""
     host: str = "0.0.0.0"
@@ -65,14 +103,14 @@ class WebConfig:
             self.base_url = os.environ.get("BRG_BASE_URL", "")
 
 
-@dataclass
+@dataclass(slots=True)
 class TelegramConfig:
     """Telegram bot configuration."""
     bot_token: str = ""
     admin_chat_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class YouTubeConfig:
     """YouTube API configuration."""
     search_max_results: int = 50
@@ -82,21 +120,71 @@ class YouTubeConfig:
     shorts_enabled: bool = False  # enable Shorts row on homepage
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseConfig:
     """Database configuration."""
     path: str = "db/videos.db"
 
 
-@dataclass
+@dataclass(slots=True)
 class WatchLimitsConfig:
     """Watch time limits configuration."""
     daily_limit_minutes: int = 0
     timezone: str = "America/New_York"
     notify_on_limit: bool = True
-
-
-@dataclass
+    # Copied from the app config at startup so web helpers can format limit messages
+    locale: str = ""
+    time_format: str = ""
+
+
+# Config section -> (section class, {field: environment variable}).
+# Variables that are unset keep the dataclass default.
+_ENV_FIELDS = {
+    "app": (AppConfig, {
+        "locale": "BRG_LOCALE",
+        "time_format": "BRG_TIME_FORMAT",
+        "log_level": "BRG_LOG_LEVEL",
+    }),
+    "web": (WebConfig, {
+        "host": "BRG_WEB_HOST",
+        "port": "BRG_WEB_PORT",
+        "poll_interval": "BRG_POLL_INTERVAL",
+        "pin": "BRG_PIN",
+        "session_secret": "BRG_SESSION_SECRET",
+        "base_url": "BRG_BASE_URL",
+    }),
+    "telegram": (TelegramConfig, {
+        "bot_token": "BRG_BOT_TOKEN",
+        "admin_chat_id": "BRG_ADMIN_CHAT_ID",
+    }),
+    "youtube": (YouTubeConfig, {
+        "search_max_results": "BRG_YOUTUBE_MAX_RESULTS",
+        "channel_cache_results": "BRG_CHANNEL_CACHE_RESULTS",
+        "channel_cache_ttl": "BRG_CHANNEL_CACHE_TTL",
+        "ydl_timeout": "BRG_YDL_TIMEOUT",
+        "shorts_enabled": "BRG_SHORTS_ENABLED",
+    }),
+    "database": (DatabaseConfig, {
+        "path": "BRG_DB_PATH",
+    }),
+    "watch_limits": (WatchLimitsConfig, {
+        "daily_limit_minutes": "BRG_DAILY_LIMIT_MINUTES",
+        "timezone": "BRG_TIMEZONE",
+        "notify_on_limit": "BRG_NOTIFY_ON_LIMIT",
+    }),
+}
+
+
+def _coerce_env(raw: str, typ: type) -> Any:
+    """Convert an environment string to a config field's type."""
+    if typ is bool:
+        return raw.lower() == "true"
+    if typ is int:
+        return int(raw)
+    return raw
+
+
+@dataclass(slots=True)
 class Config:
     """Main configuration container."""
     app: AppConfig = field(default_factory=AppConfig)
@@ -109,12 +197,12 @@ class Config:
     @classmethod
     def from_yaml(cls, path: Path | str) -> "Config":
         """Load configuration from YAML file with environment variable expansion."""
-        path = Path(path)
-        with open(path, "r") as f:
-            raw_config = yaml.safe_load(f)
+        raw_config = load_yaml(path)
+        if not raw_config:
+            return cls()  # empty file (or only comments): all defaults
 
-        # Expand environment variables
-        expanded_config = expand_env_vars(raw_config)
+        # Expand environment variables (the parsed document is ours to modify)
+        expanded_config = _expand_env_inplace(raw_config)
 
         # Construct Config from expanded data
         app_data = expanded_config.get("app", {})
@@ -136,40 +224,27 @@ class Config:
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration directly from environment variables."""
-        return cls(
-            app=AppConfig(
-                locale=os.environ.get("BRG_LOCALE", "en"),
-                time_format=os.environ.get("BRG_TIME_FORMAT", "locale"),
-                log_level=os.environ.get("BRG_LOG_LEVEL", "info"),
-            ),
-            web=WebConfig(
-                host=os.environ.get("BRG_WEB_HOST", "0.0.0.0"),
-                port=int(os.environ.get("BRG_WEB_PORT", "8080")),
-                poll_interval=int(os.environ.get("BRG_POLL_INTERVAL", "3000")),
-                pin=os.environ.get("BRG_PIN", ""),
-                session_secret=os.environ.get("BRG_SESSION_SECRET", ""),
-                base_url=os.environ.get("BRG_BASE_URL", ""),
-            ),
-            telegram=TelegramConfig(
-                bot_token=os.environ.get("BRG_BOT_TOKEN", ""),
-                admin_chat_id=os.environ.get("BRG_ADMIN_CHAT_ID", ""),
-            ),
-            youtube=YouTubeConfig(
-                search_max_results=int(os.environ.get("BRG_YOUTUBE_MAX_RESULTS", "50")),
-                channel_cache_results=int(os.environ.get("BRG_CHANNEL_CACHE_RESULTS", "200")),
-                channel_cache_ttl=int(os.environ.get("BRG_CHANNEL_CACHE_TTL", "1800")),
-                ydl_timeout=int(os.environ.get("BRG_YDL_TIMEOUT", "30")),
-                shorts_enabled=os.environ.get("BRG_SHORTS_ENABLED", "false").lower() == "true",
-            ),
-            database=DatabaseConfig(
-                path=os.environ.get("BRG_DB_PATH", "db/videos.db"),
-            ),
-            watch_limits=WatchLimitsConfig(
-                daily_limit_minutes=int(os.environ.get("BRG_DAILY_LIMIT_MINUTES", "0")),
-                timezone=os.environ.get("BRG_TIMEZONE", "America/New_York"),
-                notify_on_limit=os.environ.get("BRG_NOTIFY_ON_LIMIT", "true").lower() == "true",
-            ),
-        )
+        env = os.environ
+        sections = {}
+        for section, (section_cls, env_names) in _ENV_FIELDS.items():
+            types = {f.name: f.type for f in fields(section_cls)}
+            kwargs = {}
+            for name, var in env_names.items():
+                raw = env.get(var)
+                if raw is not None:
+                    kwargs[name] = _coerce_env(raw, types[name])
+            sections[section] = section_cls(**kwargs)
+        return cls(**sections)
+
+
+@lru_cache(maxsize=32)
+def _is_valid_timezone(tz: str) -> bool:
+    """Check that tz names an available IANA zone (result cached per name)."""
+    try:
+        ZoneInfo(tz)
+    except Exception:
+        return False
+    return True
 
 
 def load_config(config_path: str | None = None) -> Config:
@@ -213,12 +288,8 @@ def load_config(config_path: str | None = None) -> Config:
 
     # Validate timezone at startup
     tz = config.watch_limits.timezone
-    if tz:
-        try:
-            from zoneinfo import ZoneInfo
-            ZoneInfo(tz)
-        except Exception:
-            logger.warning("Invalid timezone %r in config, falling back to UTC", tz)
-            config.watch_limits.timezone = ""
+    if tz and not _is_valid_timezone(tz):
+        logger.warning("Invalid timezone %r in config, falling back to UTC", tz)
+        config.watch_limits.timezone = ""
 
     return config
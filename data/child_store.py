@@ -3,6 +3,7 @@ Per-child scoped view over VideoStore.
 Curries profile_id into all child-scoped operations.
 """
 
+from functools import partial
 from typing import Optional
 
 
@@ -13,177 +14,119 @@ class ChildStore:
     The `default` profile falls back to unprefixed keys for backwards compat.
     """
 
+    __slots__ = ("_store", "profile_id", "_bound", "_prefix", "_is_default")
+
     def __init__(self, store, profile_id: str):
         self._store = store
         self.profile_id = profile_id
+        self._bound: dict[str, partial] = {}  # method name -> store method with profile_id bound
+        self._prefix = f"{profile_id}:"
+        self._is_default = profile_id == "default"
 
     # --- Settings (prefixed by profile_id) ---
 
     def get_setting(self, key: str, default: str = "") -> str:
         """Read a setting, prefixed by profile_id. Default profile falls back to unprefixed."""
-        prefixed = self._store.get_setting(f"{self.profile_id}:{key}", "")
+        prefixed = self._store.get_setting(self._prefix + key, "")
         if prefixed:
             return prefixed
         # Backwards compat: default profile tries bare key
-        if self.profile_id == "default":
+        if self._is_default:
             return self._store.get_setting(key, default)
         return default
 
     def set_setting(self, key: str, value: str) -> None:
         """Write a setting, prefixed by profile_id."""
-        self._store.set_setting(f"{self.profile_id}:{key}", value)
+        self._store.set_setting(self._prefix + key, value)
+
+    def get_settings(self, keys) -> dict[str, str]:
+        """Read several settings in one query, with the same fallback as get_setting.
+
+        Returns unprefixed keys; keys without a non-empty value are omitted.
+        """
+        prefix = self._prefix
+        lookup = [prefix + key for key in keys]
+        if self._is_default:
+            lookup.extend(keys)
+        found = self._store.get_settings(lookup)
+        result = {}
+        for key in keys:
+            value = found.get(prefix + key) or (found.get(key) if self._is_default else "")
+            if value:
+                result[key] = value
+        return result
+
+    def set_settings(self, values: dict[str, str]) -> None:
+        """Write several settings at once, prefixed by profile_id."""
+        prefix = self._prefix
+        self._store.set_settings({prefix + key: value for key, value in values.items()})
+
+    def has_any_setting(self, keys) -> bool:
+        """Check if any of the given settings is non-empty, with the same fallback as get_setting."""
+        prefix = self._prefix
+        lookup = [prefix + key for key in keys]
+        if self._is_default:
+            lookup.extend(keys)
+        return self._store.has_any_setting(lookup)
 
     # --- Delegated methods (profile_id curried) ---
 
-    def add_video(self, video_id, title, channel_name, **kw):
-        return self._store.add_video(video_id, title, channel_name, profile_id=self.profile_id, **kw)
-
-    def get_video(self, video_id):
-        return self._store.get_video(video_id, profile_id=self.profile_id)
-
-    def find_video_fuzzy(self, encoded_id):
-        return self._store.find_video_fuzzy(encoded_id, profile_id=self.profile_id)
-
-    def get_by_status(self, status, **kw):
-        return self._store.get_by_status(status, profile_id=self.profile_id, **kw)
-
-    def get_denied_video_ids(self):
-        return self._store.get_denied_video_ids(profile_id=self.profile_id)
-
-    def get_approved(self):
-        return self._store.get_approved(profile_id=self.profile_id)
-
-    def get_pending(self):
-        return self._store.get_pending(profile_id=self.profile_id)
-
-    def get_requested_approved(self, limit=100):
-        return self._store.get_requested_approved(limit, profile_id=self.profile_id)
-
-    def get_approved_page(self, page=0, page_size=24):
-        return self._store.get_approved_page(page, page_size, profile_id=self.profile_id)
-
-    def get_approved_shorts(self, limit=50):
-        return self._store.get_approved_shorts(limit, profile_id=self.profile_id)
-
-    def search_approved(self, query, limit=50):
-        return self._store.search_approved(query, limit, profile_id=self.profile_id)
-
-    def get_recent_requests(self, limit=0):
-        return self._store.get_recent_requests(limit, profile_id=self.profile_id)
-
-    def get_active_videos(self, limit=50):
-        return self._store.get_active_videos(limit, profile_id=self.profile_id)
-
-    def get_watch_history(self, limit=200):
-        return self._store.get_watch_history(limit, profile_id=self.profile_id)
-
-    def get_watch_history_page(self, offset=0, limit=50):
-        return self._store.get_watch_history_page(offset, limit, profile_id=self.profile_id)
-
-    def update_status(self, video_id, status):
-        return self._store.update_status(video_id, status, profile_id=self.profile_id)
-
-    def record_view(self, video_id):
-        return self._store.record_view(video_id, profile_id=self.profile_id)
-
-    def record_search(self, query, result_count):
-        return self._store.record_search(query, result_count, profile_id=self.profile_id)
-
-    def get_recent_searches(self, days=7, limit=50):
-        return self._store.get_recent_searches(days, limit, profile_id=self.profile_id)
-
-    def record_watch_seconds(self, video_id, seconds):
-        return self._store.record_watch_seconds(video_id, seconds, profile_id=self.profile_id)
-
-    def update_playback_position(self, video_id, position_seconds):
-        return self._store.update_playback_position(video_id, position_seconds, profile_id=self.profile_id)
-
-    def get_video_watch_minutes(self, video_id):
-        return self._store.get_video_watch_minutes(video_id, profile_id=self.profile_id)
-
-    def get_batch_watch_minutes(self, video_ids):
-        return self._store.get_batch_watch_minutes(video_ids, profile_id=self.profile_id)
-
-    def get_batch_progress_info(self, video_ids):
-        return self._store.get_batch_progress_info(video_ids, profile_id=self.profile_id)
-
-    def get_daily_watch_minutes(self, date_str, utc_bounds=None):
-        return self._store.get_daily_watch_minutes(date_str, utc_bounds, profile_id=self.profile_id)
+    # VideoStore methods that take a profile_id keyword; positional arguments
+    # and defaults match VideoStore, so callers use the same signatures.
+    # Each is exposed through a _Curried descriptor attached below the class.
+    _CURRIED = frozenset({
+        # Videos
+        "add_video", "get_video", "find_video_fuzzy", "get_by_status",
+        "get_denied_video_ids", "get_approved", "get_pending",
+        "get_requested_approved", "get_approved_page", "get_approved_shorts",
+        "search_approved", "get_recent_requests", "get_active_videos",
+        "update_status", "record_view", "set_video_category",
+        "update_video_channel_id", "get_videos_missing_channel_id",
+        # Search and watch tracking
+        "record_search", "get_recent_searches", "record_watch_seconds", "record_heartbeat",
+        "update_playback_position", "get_video_watch_minutes",
+        "get_batch_watch_minutes", "get_batch_progress_info",
+        "get_daily_watch_minutes", "get_daily_watch_breakdown",
+        "get_daily_watch_by_category", "get_watch_history",
+        "get_watch_history_page", "get_recent_activity", "get_stats",
+        # Channels
+        "add_channel", "add_channels", "remove_channel", "get_channels", "get_channels_with_ids",
+        "is_channel_allowed", "is_channel_blocked", "get_channel_handles_set",
+        "get_blocked_channels_set", "resolve_channel_name", "get_channel_category",
+        "set_channel_category", "set_channel_videos_category",
+        "delete_channel_videos", "get_channels_missing_handles",
+        "get_channels_missing_ids", "update_channel_id", "update_channel_handle",
+    })
 
-    def get_daily_watch_breakdown(self, date_str, utc_bounds=None):
-        return self._store.get_daily_watch_breakdown(date_str, utc_bounds, profile_id=self.profile_id)
-
-    def get_daily_watch_by_category(self, date_str, utc_bounds=None):
-        return self._store.get_daily_watch_by_category(date_str, utc_bounds, profile_id=self.profile_id)
-
-    def set_channel_category(self, name_or_handle, category):
-        return self._store.set_channel_category(name_or_handle, category, profile_id=self.profile_id)
-
-    def set_video_category(self, video_id, category):
-        return self._store.set_video_category(video_id, category, profile_id=self.profile_id)
-
-    def set_channel_videos_category(self, channel_name, category, channel_id=""):
-        return self._store.set_channel_videos_category(channel_name, category, channel_id, profile_id=self.profile_id)
-
-    def get_channel_category(self, channel_name):
-        return self._store.get_channel_category(channel_name, profile_id=self.profile_id)
-
-    def add_channel(self, name, status, **kw):
-        return self._store.add_channel(name, status, profile_id=self.profile_id, **kw)
-
-    def remove_channel(self, name_or_handle):
-        return self._store.remove_channel(name_or_handle, profile_id=self.profile_id)
-
-    def delete_channel_videos(self, channel_name, channel_id=""):
-        return self._store.delete_channel_videos(channel_name, channel_id, profile_id=self.profile_id)
-
-    def resolve_channel_name(self, name_or_handle):
-        return self._store.resolve_channel_name(name_or_handle, profile_id=self.profile_id)
-
-    def get_channels_missing_handles(self):
-        return self._store.get_channels_missing_handles(profile_id=self.profile_id)
-
-    def get_channels_missing_ids(self):
-        return self._store.get_channels_missing_ids(profile_id=self.profile_id)
-
-    def get_videos_missing_channel_id(self, limit=50):
-        return self._store.get_videos_missing_channel_id(limit, profile_id=self.profile_id)
-
-    def update_channel_id(self, channel_name, channel_id):
-        return self._store.update_channel_id(channel_name, channel_id, profile_id=self.profile_id)
-
-    def update_video_channel_id(self, video_id, channel_id):
-        return self._store.update_video_channel_id(video_id, channel_id, profile_id=self.profile_id)
-
-    def update_channel_handle(self, channel_name, handle):
-        return self._store.update_channel_handle(channel_name, handle, profile_id=self.profile_id)
-
-    def get_channels(self, status):
-        return self._store.get_channels(status, profile_id=self.profile_id)
+    # --- Pass-through for global operations ---
 
-    def get_channels_with_ids(self, status):
-        return self._store.get_channels_with_ids(status, profile_id=self.profile_id)
+    def __getattr__(self, name):
+        """Delegate unknown attributes to the underlying store (global ops)."""
+        return getattr(self._store, name)
 
-    def is_channel_allowed(self, name, channel_id=""):
-        return self._store.is_channel_allowed(name, channel_id, profile_id=self.profile_id)
 
-    def is_channel_blocked(self, name, channel_id=""):
-        return self._store.is_channel_blocked(name, channel_id, profile_id=self.profile_id)
+class _Curried:
+    """Descriptor exposing VideoStore.<name> with the instance's profile_id bound.
 
-    def get_channel_handles_set(self):
-        return self._store.get_channel_handles_set(profile_id=self.profile_id)
+    The functools.partial is built on first access and kept per instance, so
+    later calls go straight to the store method without a wrapper frame.
+    """
 
-    def get_blocked_channels_set(self):
-        return self._store.get_blocked_channels_set(profile_id=self.profile_id)
+    __slots__ = ("name",)
 
-    def get_recent_activity(self, days=7, limit=50):
-        return self._store.get_recent_activity(days, limit, profile_id=self.profile_id)
+    def __init__(self, name: str):
+        self.name = name
 
-    def get_stats(self):
-        return self._store.get_stats(profile_id=self.profile_id)
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        bound = obj._bound.get(self.name)
+        if bound is None:
+            bound = obj._bound[self.name] = partial(
+                getattr(obj._store, self.name), profile_id=obj.profile_id)
+        return bound
 
-    # --- Pass-through for global operations ---
 
-    def __getattr__(self, name):
-        """Delegate unknown attributes to the underlying store (global ops)."""
-        return getattr(self._store, name)
+for _name in ChildStore._CURRIED:
+    setattr(ChildStore, _name, _Curried(_name))
+del _name
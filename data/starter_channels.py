@@ -2,60 +2,80 @@
 
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from utils import load_yaml
 
 logger = logging.getLogger(__name__)
 
 _HANDLE_RE = re.compile(r"^@[\w.-]+$")
-_VALID_CATEGORIES = {"edu", "fun"}
+_VALID_CATEGORIES = frozenset({"edu", "fun"})
+
+
+def _parse_entry(entry) -> Optional[dict]:
+    """Validate one starter channel entry; returns None (with a warning) if unusable."""
+    if not isinstance(entry, dict):
+        return None
+    handle = entry.get("handle", "").strip()
+    name = entry.get("name", "").strip()
+    if not handle or not name:
+        logger.warning("Skipping starter channel missing handle/name: %s", entry)
+        return None
+    if not _HANDLE_RE.match(handle):
+        logger.warning("Skipping invalid handle: %s", handle)
+        return None
+    category = entry.get("category", "").strip().lower() or None
+    if category and category not in _VALID_CATEGORIES:
+        logger.warning("Skipping invalid category '%s' for %s", category, handle)
+        category = None
+    return {
+        "handle": handle.lower(),
+        "name": name,
+        "category": category,
+        "description": entry.get("description", "").strip(),
+    }
 
 
 def load_starter_channels(path: Optional[Path] = None) -> list[dict]:
     """Load and validate starter channels from a YAML file.
 
     Returns a list of dicts with keys: handle, name, category, description.
-    Returns [] if the file is missing or invalid.
+    Returns [] if the file is missing or invalid. The file is parsed again
+    only when its mtime or size changes; each call gets its own copies.
     """
-    if path is None or not path.exists():
-        logger.debug(f"Starter channels file not found: {path}")
+    if path is None:
+        logger.debug("Starter channels file not found: %s", path)
         return []
+    try:
+        st = path.stat()
+    except OSError:
+        logger.debug("Starter channels file not found: %s", path)
+        return []
+    return [dict(ch) for ch in _load_starter_cached(str(path.resolve()), st.st_mtime_ns, st.st_size)]
+
 
+@lru_cache(maxsize=8)
+def _load_starter_cached(abs_path: str, mtime_ns: int, size: int) -> tuple[dict, ...]:
+    """Parse and validate one version (by mtime and size) of a starter channels file.
+
+    The cached entries are never handed out directly; load_starter_channels copies them.
+    """
     try:
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(abs_path)
     except Exception as e:
-        logger.warning(f"Failed to load starter channels: {e}")
-        return []
+        logger.warning("Failed to load starter channels: %s", e)
+        return ()
 
+    if data is None:
+        logger.debug("Starter channels file is empty: %s", abs_path)
+        return ()
     if not isinstance(data, dict) or "channels" not in data:
         logger.warning("Starter channels file missing 'channels' key")
-        return []
+        return ()
+
+    result = tuple(ch for ch in map(_parse_entry, data["channels"]) if ch is not None)
 
-    result = []
-    for entry in data["channels"]:
-        if not isinstance(entry, dict):
-            continue
-        handle = entry.get("handle", "").strip()
-        name = entry.get("name", "").strip()
-        if not handle or not name:
-            logger.warning(f"Skipping starter channel missing handle/name: {entry}")
-            continue
-        if not _HANDLE_RE.match(handle):
-            logger.warning(f"Skipping invalid handle: {handle}")
-            continue
-        category = entry.get("category", "").strip().lower() or None
-        if category and category not in _VALID_CATEGORIES:
-            logger.warning(f"Skipping invalid category '{category}' for {handle}")
-            category = None
-        result.append({
-            "handle": handle.lower(),
-            "name": name,
-            "category": category,
-            "description": entry.get("description", "").strip(),
-        })
-
-    logger.info(f"Loaded {len(result)} starter channels")
+    logger.info("Loaded %d starter channels", len(result))
     return result
@@ -4,9 +4,13 @@ Tracks video requests, approval status, view history, watch time, and channel li
 Supports per-child profiles with isolated data.
 """
 
+import hmac
+import json
 import logging
 import sqlite3
+import string
 import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
@@ -16,10 +20,16 @@ from youtube.extractor import THUMB_ALLOWED_HOSTS
 logger = logging.getLogger(__name__)
 
 
+# Exact https://host/ prefixes for the allowlist; anything else takes the urlparse path
+_THUMB_PREFIXES = tuple(f"https://{host}/" for host in sorted(THUMB_ALLOWED_HOSTS))
+
+
 def _validate_thumbnail_url(url: Optional[str]) -> Optional[str]:
     """Return the URL only if it points to an allowlisted YouTube CDN host."""
     if not url:
         return None
+    if url.startswith(_THUMB_PREFIXES):
+        return url
     try:
         parsed = urlparse(url)
         if parsed.scheme == "https" and parsed.hostname in THUMB_ALLOWED_HOSTS:
@@ -29,6 +39,50 @@ def _validate_thumbnail_url(url: Optional[str]) -> Optional[str]:
     return None
 
 
+# Row ids of a profile's channel matched by name or @handle. Each UNION arm is a
+# single index probe; an OR across the two columns can fall back to a scan.
+_CHANNEL_BY_NAME_OR_HANDLE = (
+    "SELECT id FROM channels WHERE channel_name = ? COLLATE NOCASE AND profile_id = ? "
+    "UNION SELECT id FROM channels WHERE handle = ? COLLATE NOCASE AND profile_id = ?"
+)
+
+
+# A watched video's category: its own, else its channel's. Several channel rows
+# may share a channel_id (e.g. after a rename), so the channel side is a single
+# scalar probe, never a join that could repeat the video's row.
+_VIDEO_CATEGORY = (
+    "COALESCE(v.category, (SELECT c.category FROM channels c "
+    "WHERE c.profile_id = ? AND c.channel_id = v.channel_id AND v.channel_id != '' LIMIT 1))"
+)
+
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _nocase(text: str) -> str:
+    """Fold text the way SQLite's NOCASE collation does: ASCII letters only."""
+    return text.lower() if text.isascii() else text.translate(_ASCII_LOWER)
+
+
+def _rows_to_dicts(cursor: sqlite3.Cursor) -> list[dict]:
+    """Fetch all rows as dicts, resolving the column names once per result set."""
+    columns = tuple(col[0] for col in cursor.description)
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _utc_cutoff(days: int) -> str:
+    """UTC timestamp N days ago, in the same text format as SQLite's datetime('now')."""
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _day_window(date_str: str, utc_bounds: tuple[str, str] | None) -> tuple[str, str]:
+    """[start, end) watched_at bounds for a day: the caller's UTC bounds, else date_str to the next day."""
+    if utc_bounds:
+        return utc_bounds
+    next_day = datetime.strptime(date_str, "%Y-%m-%d") + timedelta(days=1)
+    return date_str, next_day.strftime("%Y-%m-%d")
+
+
 class VideoStore:
     """SQLite database for video approval and parental control tracking."""
 
@@ -37,14 +91,102 @@ class VideoStore:
         db_file = Path(db_path)
         db_file.parent.mkdir(parents=True, exist_ok=True)
 
-        self._lock = threading.Lock()
-        self.conn = sqlite3.connect(db_file, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        self._db_file = db_file
+        self._lock = threading.Lock()  # serializes writes on self.conn
+        self.conn = self._connect()
         self.conn.execute("PRAGMA journal_mode=WAL")
+        # Commits never checkpoint inline; a background thread does it (see _checkpoint_loop)
+        self.conn.execute("PRAGMA wal_autocheckpoint=0")
+        # WAL lets readers run alongside the writer: each thread reads on its own connection
+        self._local = threading.local()
+        self._read_conns: list[sqlite3.Connection] = []
+        # Rarely-changing lookup sets; writers clear them and bump the generation
+        # profile_id -> {status: (channel_ids, lowercased channel names)}
+        self._channel_cache: dict[str, dict[str, tuple[frozenset[str], ...]]] = {}
+        self._handles_cache: dict[str, frozenset[str]] = {}  # profile_id -> lowercased @handles
+        self._word_filters_cache: Optional[frozenset[str]] = None
+        self._profiles_cache: Optional[tuple[dict, ...]] = None  # ordered by created_at
+        # Whole settings table, loaded on first read; writers update it in place
+        self._settings_cache: Optional[dict[str, str]] = None
+        self._settings_gen = 0
+        self._lookup_gen = 0
+        self._columns: dict[str, set[str]] = {}  # table -> column names, for migrations
         self._create_tables()
+        self._stop_checkpoints = threading.Event()
+        self._checkpointer = threading.Thread(
+            target=self._checkpoint_loop, name="videostore-checkpoint", daemon=True)
+        self._checkpointer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the store's row factory and PRAGMAs."""
+        # ~100 distinct statements: room for all of them in the prepared-statement cache
+        conn = sqlite3.connect(self._db_file, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        # WAL is crash-safe with NORMAL (no fsync per commit, only at checkpoint)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")  # up to 64 MB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")  # serve reads from a 256 MB map
+        conn.execute("PRAGMA busy_timeout=5000")  # wait out a checkpoint or the other writer
+        return conn
+
+    _CHECKPOINT_INTERVAL = 30.0  # seconds between PASSIVE checkpoints
+    _TRUNCATE_EVERY = 10  # every Nth checkpoint also truncates the WAL file
+
+    def _checkpoint_loop(self) -> None:
+        """Copy WAL pages back into the database off the request path.
+
+        Uses its own connection, so PASSIVE checkpoints never wait on the
+        write lock; TRUNCATE waits (up to the busy timeout) for active
+        readers and writers, then resets the WAL file to zero bytes.
+        """
+        conn = sqlite3.connect(self._db_file, check_same_thread=False)
+        try:
+            rounds = 0
+            while not self._stop_checkpoints.wait(self._CHECKPOINT_INTERVAL):
+                rounds += 1
+                mode = "TRUNCATE" if rounds % self._TRUNCATE_EVERY == 0 else "PASSIVE"
+                try:
+                    conn.execute(f"PRAGMA wal_checkpoint({mode})")
+                except sqlite3.Error as e:
+                    logger.warning("WAL checkpoint (%s) failed: %s", mode, e)
+        finally:
+            conn.close()
+
+    def _truncate_wal(self) -> None:
+        """Checkpoint and truncate the WAL on the write connection (caller holds _lock).
+
+        Best effort: the checkpoint fails while a statement on this connection
+        is still open, and the background loop will catch up later.
+        """
+        try:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            logger.debug("WAL truncate skipped: %s", e)
+
+    def _invalidate_lookups(self) -> None:
+        """Drop cached profiles, channel lists and word filters after a write (caller holds _lock)."""
+        self._channel_cache.clear()
+        self._handles_cache.clear()
+        self._word_filters_cache = None
+        self._profiles_cache = None
+        self._lookup_gen += 1
+
+    def _read_conn(self) -> sqlite3.Connection:
+        """This thread's read-only connection (opened on first use, no lock needed)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            conn.execute("PRAGMA query_only=ON")
+            with self._lock:
+                self._read_conns.append(conn)
+        return conn
 
     def _create_tables(self) -> None:
         """Create all tables if they don't exist."""
+        # DDL would otherwise autocommit statement by statement; build the schema
+        # (including column migrations) in one transaction, committed below
+        self.conn.execute("BEGIN IMMEDIATE")
         # --- Profiles table (new for multi-child) ---
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS profiles (
@@ -81,9 +223,6 @@ class VideoStore:
                 profile_id TEXT NOT NULL DEFAULT 'default'
             )
         """)
-        self.conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_watch_log_date ON watch_log(watched_at)
-        """)
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS channels (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -111,7 +250,7 @@ class VideoStore:
                 key TEXT PRIMARY KEY,
                 value TEXT NOT NULL,
                 updated_at TEXT NOT NULL DEFAULT (datetime('now'))
-            )
+            ) WITHOUT ROWID
         """)
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS search_log (
@@ -125,23 +264,145 @@ class VideoStore:
         self.conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_search_log_date ON search_log(searched_at)
         """)
-        self.conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_watch_log_video ON watch_log(video_id)
-        """)
-        self.conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_videos_status ON videos(status)
-        """)
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS word_filters (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                word TEXT NOT NULL UNIQUE COLLATE NOCASE,
+                word TEXT NOT NULL PRIMARY KEY COLLATE NOCASE,
                 added_at TEXT NOT NULL DEFAULT (datetime('now'))
-            )
+            ) WITHOUT ROWID
         """)
         self.conn.commit()
+        self._migrate_without_rowid()
 
         # Run multi-child profile migrations for existing databases
         self._migrate_profile_id()
+        self._create_profile_indexes()
+        self._has_fts = self._create_search_index()
+
+    def _create_profile_indexes(self) -> None:
+        """Create indexes on profile_id columns (after legacy tables gain them)."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        # Date-range aggregations read every column they need from this index
+        self._replace_index(
+            "idx_watch_log_date", "idx_watch_log_date_cov",
+            "watch_log(watched_at, profile_id, video_id, duration)", analyze="watch_log",
+        )
+        # Per-video totals (single and batch) sum duration from this index alone
+        self._replace_index(
+            "idx_watch_log_video", "idx_watch_log_video_profile",
+            "watch_log(video_id, profile_id, duration)", analyze="watch_log",
+        )
+        # Per-profile status listings filter and sort straight from the index;
+        # the composites below make the single-column indexes redundant
+        self.conn.execute("DROP INDEX IF EXISTS idx_videos_status")
+        self.conn.execute("DROP INDEX IF EXISTS idx_videos_profile")
+        self.conn.execute("DROP INDEX IF EXISTS idx_channels_profile")
+        self.conn.execute("DROP INDEX IF EXISTS idx_videos_profile_channel_status")
+        self.conn.execute("DROP INDEX IF EXISTS idx_videos_profile_channel_id")
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_profile_status_requested
+            ON videos(profile_id, status, requested_at DESC)
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_profile_status_decided
+            ON videos(profile_id, status, decided_at DESC, requested_at DESC)
+        """)
+        # get_by_status per channel (by id or by name): exact seek in requested_at order
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_profile_channel_id_status
+            ON videos(profile_id, channel_id, status, requested_at DESC)
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_channels_profile_channel_id
+            ON channels(profile_id, channel_id)
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_profile_channel_name_status
+            ON videos(profile_id, channel_name COLLATE NOCASE, status, requested_at DESC)
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_profile_status_views
+            ON videos(profile_id, status, view_count)
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_channels_handle
+            ON channels(handle COLLATE NOCASE, profile_id)
+        """)
+        # get_recent_activity: profile's requests newest first, without a sort
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_profile_requested
+            ON videos(profile_id, requested_at DESC)
+        """)
+        # get_channels / blocked set: status filter, rows already in name order
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_channels_profile_status
+            ON channels(profile_id, status, channel_name)
+        """)
+        # get_denied_video_ids reads only this small partial index
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_denied
+            ON videos(profile_id, status, video_id) WHERE status = 'denied'
+        """)
+        # Backfill scans (get_*_missing_*) read only rows still lacking a handle or
+        # channel_id; each query repeats the index's WHERE term verbatim
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_channels_missing_handle
+            ON channels(profile_id, channel_id) WHERE handle IS NULL OR handle = ''
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_channels_missing_cid
+            ON channels(profile_id) WHERE channel_id IS NULL OR channel_id = ''
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_missing_cid
+            ON videos(profile_id, requested_at DESC) WHERE channel_id IS NULL OR channel_id = ''
+        """)
+        # find_video_fuzzy matches on this exact expression
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_id_norm
+            ON videos(REPLACE(video_id, '-', '_'), profile_id)
+        """)
+        self.conn.commit()
+
+    def _create_search_index(self) -> bool:
+        """Create the trigram full-text index behind search_approved.
+
+        videos_fts is an external-content FTS5 table over videos.title and
+        channel_name, kept in sync by triggers. Returns False when this SQLite
+        build lacks FTS5 or the trigram tokenizer (search then scans with LIKE).
+        """
+        existed = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'videos_fts'"
+        ).fetchone()
+        try:
+            self.conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS videos_fts USING fts5(
+                    title, channel_name, content='videos', content_rowid='id',
+                    tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS videos_fts_insert AFTER INSERT ON videos BEGIN
+                    INSERT INTO videos_fts(rowid, title, channel_name)
+                    VALUES (new.id, new.title, new.channel_name);
+                END;
+                CREATE TRIGGER IF NOT EXISTS videos_fts_delete AFTER DELETE ON videos BEGIN
+                    INSERT INTO videos_fts(videos_fts, rowid, title, channel_name)
+                    VALUES ('delete', old.id, old.title, old.channel_name);
+                END;
+                CREATE TRIGGER IF NOT EXISTS videos_fts_update
+                AFTER UPDATE OF title, channel_name ON videos BEGIN
+                    INSERT INTO videos_fts(videos_fts, rowid, title, channel_name)
+                    VALUES ('delete', old.id, old.title, old.channel_name);
+                    INSERT INTO videos_fts(rowid, title, channel_name)
+                    VALUES (new.id, new.title, new.channel_name);
+                END;
+            """)
+        except sqlite3.OperationalError as e:
+            logger.info("Full-text search unavailable, searching with LIKE: %s", e)
+            return False
+        if not existed:
+            # Index the rows that predate the table
+            self.conn.execute("INSERT INTO videos_fts(videos_fts) VALUES ('rebuild')")
+        self.conn.commit()
+        return True
 
     _ALLOWED_TABLES = {"channels", "videos", "watch_log", "settings", "search_log", "word_filters", "profiles"}
     _ALLOWED_COLUMNS = {"channel_id", "handle", "category", "is_short", "profile_id", "avatar_icon", "avatar_color", "yt_view_count", "resume_seconds"}
@@ -150,16 +411,83 @@ class VideoStore:
         """Add a column to a table if it doesn't already exist (migration helper)."""
         if table not in self._ALLOWED_TABLES or column not in self._ALLOWED_COLUMNS:
             raise ValueError(f"Disallowed migration target: {table}.{column}")
-        cursor = self.conn.execute(f'PRAGMA table_info("{table}")')
-        columns = {row[1] for row in cursor.fetchall()}
+        columns = self._table_columns(table)
         if column not in columns:
+            # Committed with the caller's transaction (or on its own in autocommit)
             self.conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{column}" {col_type}')
-            self.conn.commit()
+            columns.add(column)
+
+    def _table_columns(self, table: str) -> set[str]:
+        """Column names of a table, read once per startup (migration helper).
+
+        Table rebuilds drop the table's entry so the next call re-reads it.
+        """
+        columns = self._columns.get(table)
+        if columns is None:
+            cursor = self.conn.execute(f'PRAGMA table_info("{table}")')
+            columns = self._columns[table] = {row[1] for row in cursor.fetchall()}
+        return columns
+
+    def _replace_index(self, old: str, new: str, definition: str, analyze: str = "") -> None:
+        """Create index `new` in place of `old` (migration helper; caller commits).
+
+        When the index is built for the first time, `analyze` names a table
+        whose statistics are refreshed so the planner starts using it.
+        """
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (new,)
+        ).fetchone()
+        if exists:
+            return
+        self.conn.execute(f"CREATE INDEX {new} ON {definition}")
+        self.conn.execute(f"DROP INDEX IF EXISTS {old}")
+        if analyze:
+            self.conn.execute(f'ANALYZE "{analyze}"')
 
     def _has_column(self, table: str, column: str) -> bool:
         """Check if a table has a specific column."""
-        cursor = self.conn.execute(f'PRAGMA table_info("{table}")')
-        return column in {row[1] for row in cursor.fetchall()}
+        return column in self._table_columns(table)
+
+    def _is_without_rowid(self, table: str) -> bool:
+        """Check if a table was created WITHOUT ROWID."""
+        row = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        return bool(row) and "WITHOUT ROWID" in row[0].upper()
+
+    def _migrate_without_rowid(self) -> None:
+        """Rebuild key-addressed tables from older databases as WITHOUT ROWID.
+
+        settings and word_filters are only ever looked up by their text key;
+        clustering rows on that key drops the extra rowid B-tree hop.
+        """
+        if not self._is_without_rowid("settings"):
+            self.conn.executescript("""
+                CREATE TABLE settings_new (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+                ) WITHOUT ROWID;
+                INSERT INTO settings_new (key, value, updated_at)
+                SELECT key, value, updated_at FROM settings;
+                DROP TABLE settings;
+                ALTER TABLE settings_new RENAME TO settings;
+            """)
+            self.conn.commit()
+            logger.info("Migrated settings to WITHOUT ROWID")
+        if not self._is_without_rowid("word_filters"):
+            self.conn.executescript("""
+                CREATE TABLE word_filters_new (
+                    word TEXT NOT NULL PRIMARY KEY COLLATE NOCASE,
+                    added_at TEXT NOT NULL DEFAULT (datetime('now'))
+                ) WITHOUT ROWID;
+                INSERT OR IGNORE INTO word_filters_new (word, added_at)
+                SELECT word, added_at FROM word_filters;
+                DROP TABLE word_filters;
+                ALTER TABLE word_filters_new RENAME TO word_filters;
+            """)
+            self.conn.commit()
+            logger.info("Migrated word_filters to WITHOUT ROWID")
 
     def _migrate_profile_id(self) -> None:
         """Migrate existing tables to include profile_id column.
@@ -221,6 +549,7 @@ class VideoStore:
             CREATE INDEX IF NOT EXISTS idx_videos_profile ON videos(profile_id);
         """)
         self.conn.commit()
+        self._columns.pop("videos", None)
 
     def _rebuild_channels_table(self) -> None:
         """Rebuild channels table with profile_id and new unique constraint."""
@@ -245,38 +574,47 @@ class VideoStore:
             CREATE INDEX IF NOT EXISTS idx_channels_profile ON channels(profile_id);
         """)
         self.conn.commit()
+        self._columns.pop("channels", None)
 
     # --- Profile CRUD ---
 
+    def _cached_profiles(self) -> tuple[dict, ...]:
+        """All profiles, cached until a profile write (callers must copy before handing out)."""
+        cached = self._profiles_cache
+        if cached is not None:
+            return cached
+        gen = self._lookup_gen
+        cursor = self._read_conn().execute(
+            "SELECT id, display_name, pin, created_at, avatar_icon, avatar_color FROM profiles ORDER BY created_at"
+        )
+        profiles = tuple(_rows_to_dicts(cursor))
+        with self._lock:
+            if gen == self._lookup_gen:  # no write landed while we were reading
+                self._profiles_cache = profiles
+        return profiles
+
     def get_profiles(self) -> list[dict]:
         """Get all profiles."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT id, display_name, pin, created_at, avatar_icon, avatar_color FROM profiles ORDER BY created_at"
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        return [dict(p) for p in self._cached_profiles()]
 
     def get_profile(self, profile_id: str) -> Optional[dict]:
         """Get a profile by ID."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT id, display_name, pin, created_at, avatar_icon, avatar_color FROM profiles WHERE id = ?",
-                (profile_id,),
-            )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        for p in self._cached_profiles():
+            if p["id"] == profile_id:
+                return dict(p)
+        return None
 
     def get_profile_by_pin(self, pin: str) -> Optional[dict]:
         """Get a profile by PIN. Returns None if no match or PIN is empty."""
         if not pin:
             return None
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT id, display_name, pin, created_at, avatar_icon, avatar_color FROM profiles WHERE pin = ?",
-                (pin,),
-            )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        match = None
+        given = pin.encode()
+        # Compare against every profile so timing doesn't reveal which one matched
+        for p in self._cached_profiles():
+            if hmac.compare_digest(p["pin"].encode(), given) and match is None:
+                match = p
+        return dict(match) if match else None
 
     def create_profile(self, profile_id: str, display_name: str, pin: str = "",
                        icon: str = "", color: str = "") -> bool:
@@ -307,6 +645,7 @@ class VideoStore:
                         if changed:
                             logger.info("Migrated %d %s rows from 'default' to '%s'", changed, table, profile_id)
                 self.conn.commit()
+                self._invalidate_lookups()
                 return True
             except sqlite3.IntegrityError:
                 return False
@@ -331,6 +670,7 @@ class VideoStore:
                 params,
             )
             self.conn.commit()
+            self._invalidate_lookups()
             return cursor.rowcount > 0
 
     def update_profile_avatar(self, profile_id: str, icon: Optional[str] = None,
@@ -353,6 +693,7 @@ class VideoStore:
                 params,
             )
             self.conn.commit()
+            self._invalidate_lookups()
             return cursor.rowcount > 0
 
     def delete_profile(self, profile_id: str) -> bool:
@@ -367,25 +708,29 @@ class VideoStore:
             self.conn.execute("DELETE FROM watch_log WHERE profile_id = ?", (profile_id,))
             self.conn.execute("DELETE FROM channels WHERE profile_id = ?", (profile_id,))
             self.conn.execute("DELETE FROM search_log WHERE profile_id = ?", (profile_id,))
-            # Delete prefixed settings
+            # Delete prefixed settings: a key range on the primary key index
+            # (';' sorts right after ':'), with no LIKE wildcards in profile_id
             self.conn.execute(
-                "DELETE FROM settings WHERE key LIKE ?",
-                (f"{profile_id}:%",),
+                "DELETE FROM settings WHERE key >= ? AND key < ?",
+                (f"{profile_id}:", f"{profile_id};"),
             )
             self.conn.commit()
+            self._invalidate_lookups()
+            self._settings_cache = None
+            self._settings_gen += 1
             return True
 
     def find_video_approved_for_others(self, video_id: str, exclude_profile: str) -> Optional[dict]:
         """Check if a video is approved under a different profile.
         Returns the video row dict if found, else None.
         """
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT * FROM videos WHERE video_id = ? AND profile_id != ? AND status = 'approved' LIMIT 1",
-                (video_id, exclude_profile),
-            )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT * FROM videos WHERE video_id = ? AND profile_id != ? AND status = 'approved' LIMIT 1",
+            (video_id, exclude_profile),
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
 
     # --- Video CRUD ---
 
@@ -407,72 +752,74 @@ class VideoStore:
         """
         thumbnail_url = _validate_thumbnail_url(thumbnail_url)
         with self._lock:
-            self.conn.execute(
+            # RETURNING yields the row only when it was inserted; an ignored
+            # insert (repeat request, missing title/channel) writes nothing and
+            # falls through to the read below
+            row = self.conn.execute(
                 """
                 INSERT OR IGNORE INTO videos
                 (video_id, title, channel_name, thumbnail_url, duration, channel_id, is_short, profile_id, yt_view_count)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING *
                 """,
                 (video_id, title, channel_name, thumbnail_url, duration, channel_id, int(is_short), profile_id, yt_view_count or 0)
-            )
+            ).fetchone()
             self.conn.commit()
-            return self._get_video_unlocked(video_id, profile_id)
+        if row is not None:
+            return dict(row)
+        return self.get_video(video_id, profile_id=profile_id)
 
-    def _get_video_unlocked(self, video_id: str, profile_id: str = "default") -> Optional[dict]:
-        """Get video by video_id and profile_id (caller must hold _lock)."""
-        cursor = self.conn.execute(
+    def get_video(self, video_id: str, profile_id: str = "default") -> Optional[dict]:
+        """Get video by video_id and profile_id."""
+        conn = self._read_conn()
+        cursor = conn.execute(
             "SELECT * FROM videos WHERE video_id = ? AND profile_id = ?",
             (video_id, profile_id)
         )
         row = cursor.fetchone()
         return dict(row) if row else None
 
-    def get_video(self, video_id: str, profile_id: str = "default") -> Optional[dict]:
-        """Get video by video_id and profile_id."""
-        with self._lock:
-            return self._get_video_unlocked(video_id, profile_id)
-
     def find_video_fuzzy(self, encoded_id: str, profile_id: str = "default") -> Optional[dict]:
         """Find a video where hyphens were encoded as underscores (Telegram command compat)."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT * FROM videos WHERE REPLACE(video_id, '-', '_') = ? AND profile_id = ?",
-                (encoded_id, profile_id),
-            )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT * FROM videos WHERE REPLACE(video_id, '-', '_') = ? AND profile_id = ?",
+            (encoded_id, profile_id),
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
 
     def get_by_status(self, status: str, channel_name: str = "", channel_id: str = "",
                       profile_id: str = "default") -> list[dict]:
         """Get videos with given status for a profile."""
-        with self._lock:
-            if channel_id:
-                cursor = self.conn.execute(
-                    "SELECT * FROM videos WHERE status = ? AND channel_id = ? AND profile_id = ? "
-                    "ORDER BY requested_at DESC",
-                    (status, channel_id, profile_id),
-                )
-            elif channel_name:
-                cursor = self.conn.execute(
-                    "SELECT * FROM videos WHERE status = ? AND channel_name = ? COLLATE NOCASE AND profile_id = ? "
-                    "ORDER BY requested_at DESC",
-                    (status, channel_name, profile_id),
-                )
-            else:
-                cursor = self.conn.execute(
-                    "SELECT * FROM videos WHERE status = ? AND profile_id = ? ORDER BY requested_at DESC",
-                    (status, profile_id),
-                )
-            return [dict(row) for row in cursor.fetchall()]
+        conn = self._read_conn()
+        if channel_id:
+            cursor = conn.execute(
+                "SELECT * FROM videos WHERE status = ? AND channel_id = ? AND profile_id = ? "
+                "ORDER BY requested_at DESC",
+                (status, channel_id, profile_id),
+            )
+        elif channel_name:
+            cursor = conn.execute(
+                "SELECT * FROM videos WHERE status = ? AND channel_name = ? COLLATE NOCASE AND profile_id = ? "
+                "ORDER BY requested_at DESC",
+                (status, channel_name, profile_id),
+            )
+        else:
+            cursor = conn.execute(
+                "SELECT * FROM videos WHERE status = ? AND profile_id = ? ORDER BY requested_at DESC",
+                (status, profile_id),
+            )
+        return _rows_to_dicts(cursor)
 
     def get_denied_video_ids(self, profile_id: str = "default") -> set[str]:
         """Get set of denied/revoked video IDs for a profile."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT video_id FROM videos WHERE status = 'denied' AND profile_id = ?",
-                (profile_id,),
-            )
-            return {row[0] for row in cursor.fetchall()}
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT video_id FROM videos WHERE status = 'denied' AND profile_id = ?",
+            (profile_id,),
+        )
+        return {row[0] for row in cursor}
 
     def get_approved(self, profile_id: str = "default") -> list[dict]:
         """Get all approved videos for a profile."""
@@ -484,71 +831,89 @@ class VideoStore:
 
     def get_requested_approved(self, limit: int = 100, profile_id: str = "default") -> list[dict]:
         """Get approved videos that are not currently covered by an allowlisted channel."""
-        with self._lock:
-            sql = """
-                SELECT v.*
-                FROM videos v
-                WHERE v.status = 'approved'
-                  AND v.profile_id = ?
-                  AND NOT EXISTS (
-                    SELECT 1
-                    FROM channels c
-                    WHERE c.profile_id = v.profile_id
-                      AND c.status = 'allowed'
-                      AND (
-                        c.channel_name = v.channel_name COLLATE NOCASE
-                        OR (
-                          c.channel_id IS NOT NULL AND c.channel_id != ''
-                          AND v.channel_id IS NOT NULL AND v.channel_id != ''
-                          AND c.channel_id = v.channel_id
-                        )
-                      )
+        conn = self._read_conn()
+        sql = """
+            SELECT v.*
+            FROM videos v
+            WHERE v.status = 'approved'
+              AND v.profile_id = ?
+              AND NOT EXISTS (
+                SELECT 1
+                FROM channels c
+                WHERE c.profile_id = v.profile_id
+                  AND c.status = 'allowed'
+                  AND (
+                    c.channel_name = v.channel_name COLLATE NOCASE
+                    OR (
+                      c.channel_id IS NOT NULL AND c.channel_id != ''
+                      AND v.channel_id IS NOT NULL AND v.channel_id != ''
+                      AND c.channel_id = v.channel_id
+                    )
                   )
-                ORDER BY COALESCE(v.last_viewed_at, v.decided_at, v.requested_at) DESC
-            """
-            params: list = [profile_id]
-            if limit > 0:
-                sql += " LIMIT ?"
-                params.append(limit)
-            cursor = self.conn.execute(sql, params)
-            return [dict(row) for row in cursor.fetchall()]
+              )
+            ORDER BY COALESCE(v.last_viewed_at, v.decided_at, v.requested_at) DESC
+        """
+        params: list = [profile_id]
+        if limit > 0:
+            sql += " LIMIT ?"
+            params.append(limit)
+        cursor = conn.execute(sql, params)
+        return _rows_to_dicts(cursor)
 
     def get_approved_page(self, page: int = 0, page_size: int = 24,
                           profile_id: str = "default") -> tuple[list[dict], int]:
         """Get a page of approved videos with total count for a profile."""
-        with self._lock:
-            total = self.conn.execute(
+        conn = self._read_conn()
+        # The window count is taken before LIMIT, so one query yields the page and the total
+        cursor = conn.execute(
+            "SELECT *, COUNT(*) OVER () AS total_count FROM videos "
+            "WHERE status = 'approved' AND profile_id = ? "
+            "ORDER BY requested_at DESC LIMIT ? OFFSET ?",
+            (profile_id, page_size, page * page_size),
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            # Past the last page (or empty): no row to carry the total
+            total = conn.execute(
                 "SELECT COUNT(*) FROM videos WHERE status = 'approved' AND profile_id = ?",
                 (profile_id,),
             ).fetchone()[0]
-            cursor = self.conn.execute(
-                "SELECT * FROM videos WHERE status = 'approved' AND profile_id = ? "
-                "ORDER BY requested_at DESC LIMIT ? OFFSET ?",
-                (profile_id, page_size, page * page_size),
-            )
-            return [dict(row) for row in cursor.fetchall()], total
+            return [], total
+        # total_count is the last column; zip stops before it
+        columns = tuple(col[0] for col in cursor.description[:-1])
+        return [dict(zip(columns, row)) for row in rows], rows[0][-1]
 
     def get_approved_shorts(self, limit: int = 50, profile_id: str = "default") -> list[dict]:
         """Get approved Shorts for a profile."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT * FROM videos WHERE status = 'approved' AND is_short = 1 AND profile_id = ? "
-                "ORDER BY requested_at DESC LIMIT ?",
-                (profile_id, limit),
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT * FROM videos WHERE status = 'approved' AND is_short = 1 AND profile_id = ? "
+            "ORDER BY requested_at DESC LIMIT ?",
+            (profile_id, limit),
+        )
+        return _rows_to_dicts(cursor)
 
     def search_approved(self, query: str, limit: int = 50, profile_id: str = "default") -> list[dict]:
         """Search approved videos by title or channel name for a profile."""
-        pattern = f"%{query}%"
-        with self._lock:
-            cursor = self.conn.execute(
+        conn = self._read_conn()
+        # Trigram matching needs 3+ characters; LIKE wildcards in the query keep the LIKE path
+        if self._has_fts and len(query) >= 3 and "%" not in query and "_" not in query:
+            phrase = '"' + query.replace('"', '""') + '"'
+            cursor = conn.execute(
                 "SELECT * FROM videos WHERE status = 'approved' AND profile_id = ? "
-                "AND (title LIKE ? COLLATE NOCASE OR channel_name LIKE ? COLLATE NOCASE) "
+                "AND id IN (SELECT rowid FROM videos_fts WHERE videos_fts MATCH ?) "
                 "ORDER BY requested_at DESC LIMIT ?",
-                (profile_id, pattern, pattern, limit),
+                (profile_id, phrase, limit),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return _rows_to_dicts(cursor)
+        pattern = f"%{query}%"
+        cursor = conn.execute(
+            "SELECT * FROM videos WHERE status = 'approved' AND profile_id = ? "
+            "AND (title LIKE ? COLLATE NOCASE OR channel_name LIKE ? COLLATE NOCASE) "
+            "ORDER BY requested_at DESC LIMIT ?",
+            (profile_id, pattern, pattern, limit),
+        )
+        return _rows_to_dicts(cursor)
 
     def get_recent_requests(self, limit: int = 0, profile_id: str = "default") -> list[dict]:
         """Get recently approved non-Short videos for a profile.
@@ -556,88 +921,88 @@ class VideoStore:
         Limit is applied after the query; callers that filter rows (e.g. by
         allowed channels) should pass limit=0 so filtering doesn't lose results.
         """
-        with self._lock:
-            sql = ("SELECT * FROM videos WHERE status = 'approved' AND is_short = 0 AND profile_id = ? "
-                   "ORDER BY decided_at DESC, requested_at DESC")
-            params: list = [profile_id]
-            if limit:
-                sql += " LIMIT ?"
-                params.append(limit)
-            cursor = self.conn.execute(sql, params)
-            return [dict(row) for row in cursor.fetchall()]
+        conn = self._read_conn()
+        sql = ("SELECT * FROM videos WHERE status = 'approved' AND is_short = 0 AND profile_id = ? "
+               "ORDER BY decided_at DESC, requested_at DESC")
+        params: list = [profile_id]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        cursor = conn.execute(sql, params)
+        return _rows_to_dicts(cursor)
 
     def get_active_videos(self, limit: int = 50, profile_id: str = "default") -> list[dict]:
         """Get approved non-Short videos that are still active for a profile."""
-        with self._lock:
-            cursor = self.conn.execute(
-                """
-                SELECT v.*,
-                       COALESCE(SUM(w.duration), 0) AS watched_seconds,
-                       MAX(COALESCE(v.resume_seconds, 0), COALESCE(SUM(w.duration), 0)) AS progress_seconds
-                FROM videos v
-                LEFT JOIN watch_log w
-                  ON w.video_id = v.video_id
-                 AND w.profile_id = v.profile_id
-                WHERE v.status = 'approved'
-                  AND v.is_short = 0
-                  AND v.profile_id = ?
-                GROUP BY v.id
-                HAVING progress_seconds = 0
-                    OR v.duration IS NULL
-                    OR progress_seconds < (v.duration * 0.95)
-                ORDER BY
-                    CASE WHEN progress_seconds > 0 THEN 0 ELSE 1 END,
-                    COALESCE(v.last_viewed_at, v.decided_at, v.requested_at) DESC
-                LIMIT ?
-                """,
-                (profile_id, limit),
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        conn = self._read_conn()
+        cursor = conn.execute(
+            """
+            SELECT v.*,
+                   COALESCE(SUM(w.duration), 0) AS watched_seconds,
+                   MAX(COALESCE(v.resume_seconds, 0), COALESCE(SUM(w.duration), 0)) AS progress_seconds
+            FROM videos v
+            LEFT JOIN watch_log w
+              ON w.video_id = v.video_id
+             AND w.profile_id = v.profile_id
+            WHERE v.status = 'approved'
+              AND v.is_short = 0
+              AND v.profile_id = ?
+            GROUP BY v.id
+            HAVING progress_seconds = 0
+                OR v.duration IS NULL
+                OR progress_seconds < (v.duration * 0.95)
+            ORDER BY
+                CASE WHEN progress_seconds > 0 THEN 0 ELSE 1 END,
+                COALESCE(v.last_viewed_at, v.decided_at, v.requested_at) DESC
+            LIMIT ?
+            """,
+            (profile_id, limit),
+        )
+        return _rows_to_dicts(cursor)
 
     def get_watch_history(self, limit: int = 200, profile_id: str = "default") -> list[dict]:
         """Get watched videos ordered by most recent watch date for a profile."""
-        with self._lock:
-            cursor = self.conn.execute(
-                """
-                SELECT *
-                FROM videos
-                WHERE status = 'approved'
-                  AND last_viewed_at IS NOT NULL
-                  AND profile_id = ?
-                ORDER BY last_viewed_at DESC, requested_at DESC
-                LIMIT ?
-                """,
-                (profile_id, limit),
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        conn = self._read_conn()
+        cursor = conn.execute(
+            """
+            SELECT *
+            FROM videos
+            WHERE status = 'approved'
+              AND last_viewed_at IS NOT NULL
+              AND profile_id = ?
+            ORDER BY last_viewed_at DESC, requested_at DESC
+            LIMIT ?
+            """,
+            (profile_id, limit),
+        )
+        return _rows_to_dicts(cursor)
 
     def get_watch_history_page(self, offset: int = 0, limit: int = 50,
                                profile_id: str = "default") -> tuple[list[dict], int]:
         """Get a page of watched videos ordered by most recent watch date."""
-        with self._lock:
-            total = self.conn.execute(
-                """
-                SELECT COUNT(*)
-                FROM videos
-                WHERE status = 'approved'
-                  AND last_viewed_at IS NOT NULL
-                  AND profile_id = ?
-                """,
-                (profile_id,),
-            ).fetchone()[0]
-            cursor = self.conn.execute(
-                """
-                SELECT *
-                FROM videos
-                WHERE status = 'approved'
-                  AND last_viewed_at IS NOT NULL
-                  AND profile_id = ?
-                ORDER BY last_viewed_at DESC, requested_at DESC
-                LIMIT ? OFFSET ?
-                """,
-                (profile_id, limit, offset),
-            )
-            return [dict(row) for row in cursor.fetchall()], total
+        conn = self._read_conn()
+        total = conn.execute(
+            """
+            SELECT COUNT(*)
+            FROM videos
+            WHERE status = 'approved'
+              AND last_viewed_at IS NOT NULL
+              AND profile_id = ?
+            """,
+            (profile_id,),
+        ).fetchone()[0]
+        cursor = conn.execute(
+            """
+            SELECT *
+            FROM videos
+            WHERE status = 'approved'
+              AND last_viewed_at IS NOT NULL
+              AND profile_id = ?
+            ORDER BY last_viewed_at DESC, requested_at DESC
+            LIMIT ? OFFSET ?
+            """,
+            (profile_id, limit, offset),
+        )
+        return _rows_to_dicts(cursor), total
 
     def update_status(self, video_id: str, status: str, profile_id: str = "default") -> bool:
         """Update video status for a profile. Returns True if updated."""
@@ -681,30 +1046,42 @@ class VideoStore:
     def get_recent_searches(self, days: int = 7, limit: int = 50,
                             profile_id: str = "default") -> list[dict]:
         """Get recent searches for a profile."""
-        with self._lock:
-            cursor = self.conn.execute(
-                """SELECT query, result_count, searched_at
-                   FROM search_log
-                   WHERE searched_at >= datetime('now', ?) AND profile_id = ?
-                   ORDER BY searched_at DESC
-                   LIMIT ?""",
-                (f"-{days} days", profile_id, limit),
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        conn = self._read_conn()
+        cursor = conn.execute(
+            """SELECT query, result_count, searched_at
+               FROM search_log
+               WHERE searched_at >= ? AND profile_id = ?
+               ORDER BY searched_at DESC
+               LIMIT ?""",
+            (_utc_cutoff(days), profile_id, limit),
+        )
+        return _rows_to_dicts(cursor)
 
     # --- Word filters (global — not per-profile) ---
 
     def add_word_filter(self, word: str) -> bool:
         """Add a word to the filter list. Returns True if added."""
+        return self.add_word_filters([word]) == 1
+
+    def add_word_filters(self, words: list[str]) -> int:
+        """Add several words to the filter list in one transaction.
+
+        Words already filtered (case-insensitively) are skipped. Returns the
+        number of words added.
+        """
+        if not words:
+            return 0
         with self._lock:
-            try:
-                self.conn.execute(
-                    "INSERT INTO word_filters (word) VALUES (?)", (word.lower(),)
-                )
-                self.conn.commit()
-                return True
-            except sqlite3.IntegrityError:
-                return False
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO word_filters (word) VALUES (?)",
+                [(word.lower(),) for word in words],
+            )
+            self.conn.commit()
+            added = self.conn.total_changes - before
+            if added:
+                self._invalidate_lookups()
+            return added
 
     def remove_word_filter(self, word: str) -> bool:
         """Remove a word from the filter list. Returns True if removed."""
@@ -713,21 +1090,29 @@ class VideoStore:
                 "DELETE FROM word_filters WHERE word = ? COLLATE NOCASE", (word,)
             )
             self.conn.commit()
+            self._invalidate_lookups()
             return cursor.rowcount > 0
 
     def get_word_filters(self) -> list[str]:
         """Get all filtered words."""
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT word FROM word_filters ORDER BY word"
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    def get_word_filters_set(self) -> frozenset[str]:
+        """Get set of filtered words (lowercased), cached until the filter list changes."""
+        cached = self._word_filters_cache
+        if cached is not None:
+            return cached
+        gen = self._lookup_gen
+        cursor = self._read_conn().execute("SELECT word FROM word_filters")
+        words = frozenset(row[0].lower() for row in cursor.fetchall())
         with self._lock:
-            cursor = self.conn.execute(
-                "SELECT word FROM word_filters ORDER BY word"
-            )
-            return [row[0] for row in cursor.fetchall()]
-
-    def get_word_filters_set(self) -> set[str]:
-        """Get set of filtered words (lowercased)."""
-        with self._lock:
-            cursor = self.conn.execute("SELECT word FROM word_filters")
-            return {row[0].lower() for row in cursor.fetchall()}
+            if gen == self._lookup_gen:  # no write landed while we were reading
+                self._word_filters_cache = words
+        return words
 
     # --- Categories (edu / fun) ---
 
@@ -736,9 +1121,8 @@ class VideoStore:
         """Set a channel's category for a profile."""
         with self._lock:
             cursor = self.conn.execute(
-                "UPDATE channels SET category = ? WHERE "
-                "(channel_name = ? COLLATE NOCASE OR handle = ? COLLATE NOCASE) AND profile_id = ?",
-                (category, name_or_handle, name_or_handle, profile_id),
+                f"UPDATE channels SET category = ? WHERE id IN ({_CHANNEL_BY_NAME_OR_HANDLE})",
+                (category, name_or_handle, profile_id, name_or_handle, profile_id),
             )
             self.conn.commit()
             return cursor.rowcount > 0
@@ -779,33 +1163,35 @@ class VideoStore:
 
     def get_channel_category(self, channel_name: str, profile_id: str = "default") -> Optional[str]:
         """Get a channel's assigned category for a profile."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT category FROM channels WHERE channel_name = ? COLLATE NOCASE AND profile_id = ?",
-                (channel_name, profile_id),
-            )
-            row = cursor.fetchone()
-            return row[0] if row and row[0] else None
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT category FROM channels WHERE channel_name = ? COLLATE NOCASE AND profile_id = ?",
+            (channel_name, profile_id),
+        )
+        row = cursor.fetchone()
+        return row[0] if row and row[0] else None
 
     def get_daily_watch_by_category(self, date_str: str, utc_bounds: tuple[str, str] | None = None,
                                      profile_id: str = "default") -> dict:
         """Sum watch time per category for a date and profile."""
-        start, end = utc_bounds if utc_bounds else (date_str, date_str)
-        end_clause = "?" if utc_bounds else "date(?, '+1 day')"
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT COALESCE(v.category, c.category) as cat, "
-                "       COALESCE(SUM(w.duration), 0) as total_sec "
-                "FROM watch_log w "
-                "LEFT JOIN videos v ON w.video_id = v.video_id AND v.profile_id = ? "
-                "LEFT JOIN channels c ON v.channel_id IS NOT NULL AND v.channel_id != '' "
-                "  AND v.channel_id = c.channel_id AND c.profile_id = ? "
-                f"WHERE w.watched_at >= ? AND w.watched_at < {end_clause} "
-                "AND w.profile_id = ? "
-                "GROUP BY cat",
-                (profile_id, profile_id, start, end, profile_id),
-            )
-            return {row[0]: row[1] / 60.0 for row in cursor.fetchall()}
+        start, end = _day_window(date_str, utc_bounds)
+        conn = self._read_conn()
+        # Sum heartbeats per video first (from the covering date index), so the
+        # category joins run once per video watched rather than once per heartbeat
+        cursor = conn.execute(
+            "WITH per_video AS ("
+            "  SELECT video_id, SUM(duration) AS sec FROM watch_log "
+            "  WHERE watched_at >= ? AND watched_at < ? AND profile_id = ? "
+            "  GROUP BY video_id"
+            ") "
+            f"SELECT {_VIDEO_CATEGORY} as cat, "
+            "       COALESCE(SUM(w.sec), 0) as total_sec "
+            "FROM per_video w "
+            "LEFT JOIN videos v ON w.video_id = v.video_id AND v.profile_id = ? "
+            "GROUP BY cat",
+            (start, end, profile_id, profile_id, profile_id),
+        )
+        return {row[0]: row[1] / 60.0 for row in cursor.fetchall()}
 
     # --- Watch time tracking ---
 
@@ -829,105 +1215,124 @@ class VideoStore:
             )
             self.conn.commit()
 
+    def record_heartbeat(self, video_id: str, seconds: int, position_seconds: Optional[int] = None,
+                         profile_id: str = "default") -> None:
+        """Log playback seconds and the resume position from one heartbeat in a single commit."""
+        if seconds <= 0 and position_seconds is None:
+            return
+        with self._lock:
+            if seconds > 0:
+                self.conn.execute(
+                    "INSERT INTO watch_log (video_id, duration, profile_id) VALUES (?, ?, ?)",
+                    (video_id, seconds, profile_id),
+                )
+            if position_seconds is not None:
+                self.conn.execute(
+                    "UPDATE videos SET resume_seconds = ? WHERE video_id = ? AND profile_id = ?",
+                    (max(position_seconds, 0), video_id, profile_id),
+                )
+            self.conn.commit()
+
     def get_video_watch_minutes(self, video_id: str, profile_id: str = "default") -> float:
         """Get cumulative watch time for a video within a profile."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT COALESCE(SUM(duration), 0) FROM watch_log WHERE video_id = ? AND profile_id = ?",
-                (video_id, profile_id),
-            )
-            return cursor.fetchone()[0] / 60.0
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT COALESCE(SUM(duration), 0) FROM watch_log WHERE video_id = ? AND profile_id = ?",
+            (video_id, profile_id),
+        )
+        return cursor.fetchone()[0] / 60.0
 
     def get_batch_watch_minutes(self, video_ids: list[str],
                                 profile_id: str = "default") -> dict[str, float]:
         """Get cumulative watch time for multiple videos in a profile."""
         if not video_ids:
             return {}
-        with self._lock:
-            placeholders = ",".join("?" for _ in video_ids)
-            cursor = self.conn.execute(
-                f"SELECT video_id, COALESCE(SUM(duration), 0) "
-                f"FROM watch_log WHERE video_id IN ({placeholders}) AND profile_id = ? GROUP BY video_id",
-                video_ids + [profile_id],
-            )
-            result = {row[0]: row[1] / 60.0 for row in cursor.fetchall()}
-            for vid in video_ids:
-                if vid not in result:
-                    result[vid] = 0.0
-            return result
+        conn = self._read_conn()
+        # One statement for any batch size: the ids travel as a single JSON array
+        cursor = conn.execute(
+            "SELECT video_id, COALESCE(SUM(duration), 0) "
+            "FROM watch_log WHERE video_id IN (SELECT value FROM json_each(?)) AND profile_id = ? "
+            "GROUP BY video_id",
+            (json.dumps(list(video_ids)), profile_id),
+        )
+        result = dict.fromkeys(video_ids, 0.0)
+        result.update((row[0], row[1] / 60.0) for row in cursor.fetchall())
+        return result
 
     def get_batch_progress_info(self, video_ids: list[str],
                                profile_id: str = "default") -> dict[str, dict]:
         """Get watch minutes, resume_seconds, and duration for multiple videos."""
         if not video_ids:
             return {}
-        with self._lock:
-            placeholders = ",".join("?" for _ in video_ids)
-            cursor = self.conn.execute(
-                f"SELECT v.video_id, COALESCE(SUM(w.duration), 0), "
-                f"       v.resume_seconds, v.duration "
-                f"FROM videos v "
-                f"LEFT JOIN watch_log w ON w.video_id = v.video_id AND w.profile_id = v.profile_id "
-                f"WHERE v.video_id IN ({placeholders}) AND v.profile_id = ? AND v.status = 'approved' "
-                f"GROUP BY v.video_id",
-                video_ids + [profile_id],
-            )
-            return {
-                row[0]: {
-                    "watch_minutes": (row[1] or 0) / 60.0,
-                    "resume_seconds": row[2] or 0,
-                    "duration": row[3] or 0,
-                }
-                for row in cursor.fetchall()
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT v.video_id, COALESCE(SUM(w.duration), 0), "
+            "       v.resume_seconds, v.duration "
+            "FROM videos v "
+            "LEFT JOIN watch_log w ON w.video_id = v.video_id AND w.profile_id = v.profile_id "
+            "WHERE v.video_id IN (SELECT value FROM json_each(?)) AND v.profile_id = ? "
+            "AND v.status = 'approved' "
+            "GROUP BY v.video_id",
+            (json.dumps(list(video_ids)), profile_id),
+        )
+        return {
+            row[0]: {
+                "watch_minutes": (row[1] or 0) / 60.0,
+                "resume_seconds": row[2] or 0,
+                "duration": row[3] or 0,
             }
+            for row in cursor.fetchall()
+        }
 
     def get_daily_watch_minutes(self, date_str: str, utc_bounds: tuple[str, str] | None = None,
                                 profile_id: str = "default") -> float:
         """Sum watch time for a date and profile."""
-        start, end = utc_bounds if utc_bounds else (date_str, date_str)
-        end_clause = "?" if utc_bounds else "date(?, '+1 day')"
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT COALESCE(SUM(duration), 0) FROM watch_log "
-                f"WHERE watched_at >= ? AND watched_at < {end_clause} AND profile_id = ?",
-                (start, end, profile_id),
-            )
-            total_seconds = cursor.fetchone()[0]
-            return total_seconds / 60.0
+        start, end = _day_window(date_str, utc_bounds)
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT COALESCE(SUM(duration), 0) FROM watch_log "
+            "WHERE watched_at >= ? AND watched_at < ? AND profile_id = ?",
+            (start, end, profile_id),
+        )
+        total_seconds = cursor.fetchone()[0]
+        return total_seconds / 60.0
 
     def get_daily_watch_breakdown(self, date_str: str, utc_bounds: tuple[str, str] | None = None,
                                   profile_id: str = "default") -> list[dict]:
         """Per-video watch time for a date and profile."""
-        start, end = utc_bounds if utc_bounds else (date_str, date_str)
-        end_clause = "?" if utc_bounds else "date(?, '+1 day')"
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT w.video_id, COALESCE(SUM(w.duration), 0) as total_sec,"
-                "       v.title, v.channel_name, v.thumbnail_url,"
-                "       v.duration, v.channel_id,"
-                "       COALESCE(v.category, c.category) as category "
-                "FROM watch_log w "
-                "LEFT JOIN videos v ON w.video_id = v.video_id AND v.profile_id = ? "
-                "LEFT JOIN channels c ON v.channel_id IS NOT NULL AND v.channel_id != '' "
-                "  AND v.channel_id = c.channel_id AND c.profile_id = ? "
-                f"WHERE w.watched_at >= ? AND w.watched_at < {end_clause} "
-                "AND w.profile_id = ? "
-                "GROUP BY w.video_id ORDER BY total_sec DESC",
-                (profile_id, profile_id, start, end, profile_id),
-            )
-            return [
-                {
-                    "video_id": row[0],
-                    "minutes": round(row[1] / 60.0, 1),
-                    "title": row[2] or row[0],
-                    "channel_name": row[3] or "Unknown",
-                    "thumbnail_url": row[4] or "",
-                    "duration": row[5],
-                    "channel_id": row[6],
-                    "category": row[7],
-                }
-                for row in cursor.fetchall()
-            ]
+        start, end = _day_window(date_str, utc_bounds)
+        conn = self._read_conn()
+        # Same shape as get_daily_watch_by_category: sum per video first, then
+        # look up each watched video's details once
+        cursor = conn.execute(
+            "WITH per_video AS ("
+            "  SELECT video_id, SUM(duration) AS sec FROM watch_log "
+            "  WHERE watched_at >= ? AND watched_at < ? AND profile_id = ? "
+            "  GROUP BY video_id"
+            ") "
+            "SELECT w.video_id, w.sec as total_sec,"
+            "       v.title, v.channel_name, v.thumbnail_url,"
+            "       v.duration, v.channel_id,"
+            f"      {_VIDEO_CATEGORY} as category "
+            "FROM per_video w "
+            "LEFT JOIN videos v ON w.video_id = v.video_id AND v.profile_id = ? "
+            "ORDER BY total_sec DESC",
+            (start, end, profile_id, profile_id, profile_id),
+        )
+        # Rows are consumed straight off the cursor; no intermediate fetchall list
+        return [
+            {
+                "video_id": vid,
+                "minutes": round(total_sec / 60.0, 1),
+                "title": title or vid,
+                "channel_name": channel_name or "Unknown",
+                "thumbnail_url": thumb or "",
+                "duration": duration,
+                "channel_id": channel_id,
+                "category": category,
+            }
+            for vid, total_sec, title, channel_name, thumb, duration, channel_id, category in cursor
+        ]
 
     # --- Channel allow/block lists ---
 
@@ -935,30 +1340,50 @@ class VideoStore:
                     handle: Optional[str] = None, category: Optional[str] = None,
                     profile_id: str = "default") -> bool:
         """Add or update a channel for a profile."""
+        self.add_channels(
+            [{"name": name, "status": status, "channel_id": channel_id,
+              "handle": handle, "category": category}],
+            profile_id=profile_id,
+        )
+        return True
+
+    def add_channels(self, channels: list[dict], profile_id: str = "default") -> int:
+        """Add or update several channels for a profile in one transaction.
+
+        Each dict takes add_channel's arguments: name and status, plus optional
+        channel_id, handle and category. Returns the number of channels written.
+        """
+        rows = [
+            (ch["name"], ch["status"], ch.get("channel_id"), ch.get("handle"),
+             ch.get("category"), profile_id)
+            for ch in channels
+        ]
+        if not rows:
+            return 0
         with self._lock:
-            self.conn.execute(
+            self.conn.executemany(
                 """INSERT INTO channels (channel_name, status, channel_id, handle, category, profile_id)
                    VALUES (?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(channel_name, profile_id) DO UPDATE SET status = ?,
-                   channel_id = COALESCE(?, channel_id),
-                   handle = COALESCE(?, handle),
-                   category = COALESCE(?, category),
+                   ON CONFLICT(channel_name, profile_id) DO UPDATE SET status = excluded.status,
+                   channel_id = COALESCE(excluded.channel_id, channel_id),
+                   handle = COALESCE(excluded.handle, handle),
+                   category = COALESCE(excluded.category, category),
                    added_at = datetime('now')""",
-                (name, status, channel_id, handle, category, profile_id,
-                 status, channel_id, handle, category),
+                rows,
             )
             self.conn.commit()
-            return True
+            self._invalidate_lookups()
+            return len(rows)
 
     def remove_channel(self, name_or_handle: str, profile_id: str = "default") -> bool:
         """Remove a channel from a profile's list."""
         with self._lock:
             cursor = self.conn.execute(
-                "DELETE FROM channels WHERE "
-                "(channel_name = ? COLLATE NOCASE OR handle = ? COLLATE NOCASE) AND profile_id = ?",
-                (name_or_handle, name_or_handle, profile_id),
+                f"DELETE FROM channels WHERE id IN ({_CHANNEL_BY_NAME_OR_HANDLE})",
+                (name_or_handle, profile_id, name_or_handle, profile_id),
             )
             self.conn.commit()
+            self._invalidate_lookups()
             return cursor.rowcount > 0
 
     def delete_channel_videos(self, channel_name: str, channel_id: str = "",
@@ -987,45 +1412,46 @@ class VideoStore:
 
     def resolve_channel_name(self, name_or_handle: str, profile_id: str = "default") -> Optional[str]:
         """Look up channel_name by name or @handle for a profile."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT channel_name FROM channels WHERE "
-                "(channel_name = ? COLLATE NOCASE OR handle = ? COLLATE NOCASE) AND profile_id = ?",
-                (name_or_handle, name_or_handle, profile_id),
-            )
-            row = cursor.fetchone()
-            return row[0] if row else None
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT channel_name FROM channels WHERE channel_name = ? COLLATE NOCASE AND profile_id = ? "
+            "UNION ALL SELECT channel_name FROM channels WHERE handle = ? COLLATE NOCASE AND profile_id = ? "
+            "LIMIT 1",
+            (name_or_handle, profile_id, name_or_handle, profile_id),
+        )
+        row = cursor.fetchone()
+        return row[0] if row else None
 
     def get_channels_missing_handles(self, profile_id: str = "default") -> list[tuple[str, str]]:
         """Get (channel_name, channel_id) for channels with a channel_id but no handle."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT channel_name, channel_id FROM channels "
-                "WHERE channel_id IS NOT NULL AND (handle IS NULL OR handle = '') AND profile_id = ?",
-                (profile_id,),
-            )
-            return [(row[0], row[1]) for row in cursor.fetchall()]
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT channel_name, channel_id FROM channels "
+            "WHERE channel_id IS NOT NULL AND (handle IS NULL OR handle = '') AND profile_id = ?",
+            (profile_id,),
+        )
+        return [(row[0], row[1]) for row in cursor.fetchall()]
 
     def get_channels_missing_ids(self, profile_id: str = "default") -> list[tuple[str, Optional[str]]]:
         """Get (channel_name, handle) for channels missing channel_id."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT channel_name, handle FROM channels "
-                "WHERE (channel_id IS NULL OR channel_id = '') AND profile_id = ?",
-                (profile_id,),
-            )
-            return [(row[0], row[1]) for row in cursor.fetchall()]
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT channel_name, handle FROM channels "
+            "WHERE (channel_id IS NULL OR channel_id = '') AND profile_id = ?",
+            (profile_id,),
+        )
+        return [(row[0], row[1]) for row in cursor.fetchall()]
 
     def get_videos_missing_channel_id(self, limit: int = 50, profile_id: str = "default") -> list[dict]:
         """Get approved videos missing channel_id for a profile."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT video_id, channel_name FROM videos "
-                "WHERE (channel_id IS NULL OR channel_id = '') AND profile_id = ? "
-                "ORDER BY requested_at DESC LIMIT ?",
-                (profile_id, limit),
-            )
-            return [{"video_id": row[0], "channel_name": row[1]} for row in cursor.fetchall()]
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT video_id, channel_name FROM videos "
+            "WHERE (channel_id IS NULL OR channel_id = '') AND profile_id = ? "
+            "ORDER BY requested_at DESC LIMIT ?",
+            (profile_id, limit),
+        )
+        return [{"video_id": row[0], "channel_name": row[1]} for row in cursor.fetchall()]
 
     def update_channel_id(self, channel_name: str, channel_id: str,
                           profile_id: str = "default") -> bool:
@@ -1037,6 +1463,7 @@ class VideoStore:
                 (channel_id, channel_name, profile_id),
             )
             self.conn.commit()
+            self._invalidate_lookups()
             return cursor.rowcount > 0
 
     def update_video_channel_id(self, video_id: str, channel_id: str,
@@ -1060,90 +1487,136 @@ class VideoStore:
                 (handle, channel_name, profile_id),
             )
             self.conn.commit()
+            self._invalidate_lookups()
             return cursor.rowcount > 0
 
     def get_channels(self, status: str, profile_id: str = "default") -> list[str]:
         """List channel names by status for a profile."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT channel_name FROM channels WHERE status = ? AND profile_id = ? ORDER BY channel_name",
-                (status, profile_id),
-            )
-            return [row[0] for row in cursor.fetchall()]
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT channel_name FROM channels WHERE status = ? AND profile_id = ? ORDER BY channel_name",
+            (status, profile_id),
+        )
+        return [row[0] for row in cursor.fetchall()]
 
     def get_channels_with_ids(self, status: str,
                               profile_id: str = "default") -> list[tuple[str, Optional[str], Optional[str], Optional[str]]]:
         """List (channel_name, channel_id, handle, category) tuples by status for a profile."""
+        conn = self._read_conn()
+        cursor = conn.execute(
+            "SELECT channel_name, channel_id, handle, category FROM channels "
+            "WHERE status = ? AND profile_id = ? ORDER BY channel_name",
+            (status, profile_id),
+        )
+        return [(row[0], row[1], row[2], row[3]) for row in cursor.fetchall()]
+
+    def _channel_index(self, profile_id: str) -> dict[str, tuple[frozenset[str], ...]]:
+        """A profile's allowed/blocked channel ids, NOCASE-folded names and lowercased names.
+
+        Loaded with one query and cached until a channel list changes. The
+        NOCASE names answer the allow/block checks exactly like the SQL lookups
+        on channel_name; the lowercased names back get_blocked_channels_set.
+        """
+        cached = self._channel_cache.get(profile_id)
+        if cached is not None:
+            return cached
+        gen = self._lookup_gen
+        cursor = self._read_conn().execute(
+            "SELECT channel_id, channel_name, status FROM channels WHERE profile_id = ?",
+            (profile_id,),
+        )
+        ids: dict[str, set[str]] = {"allowed": set(), "blocked": set()}
+        names: dict[str, set[str]] = {"allowed": set(), "blocked": set()}
+        lowered: dict[str, set[str]] = {"allowed": set(), "blocked": set()}
+        for channel_id, channel_name, status in cursor:
+            if status not in ids:
+                continue
+            if channel_id:
+                ids[status].add(channel_id)
+            names[status].add(_nocase(channel_name))
+            lowered[status].add(channel_name.lower())
+        index = {
+            status: (frozenset(ids[status]), frozenset(names[status]), frozenset(lowered[status]))
+            for status in ids
+        }
         with self._lock:
-            cursor = self.conn.execute(
-                "SELECT channel_name, channel_id, handle, category FROM channels "
-                "WHERE status = ? AND profile_id = ? ORDER BY channel_name",
-                (status, profile_id),
-            )
-            return [(row[0], row[1], row[2], row[3]) for row in cursor.fetchall()]
+            if gen == self._lookup_gen:  # no write landed while we were reading
+                self._channel_cache[profile_id] = index
+        return index
 
     def is_channel_allowed(self, name: str, channel_id: str = "",
                            profile_id: str = "default") -> bool:
         """Check if channel is on the allowlist for a profile."""
-        with self._lock:
-            if channel_id:
-                cursor = self.conn.execute(
-                    "SELECT 1 FROM channels WHERE channel_id = ? AND status = 'allowed' AND profile_id = ?",
-                    (channel_id, profile_id),
-                )
-                if cursor.fetchone() is not None:
-                    return True
-            cursor = self.conn.execute(
-                "SELECT 1 FROM channels WHERE channel_name = ? COLLATE NOCASE AND status = 'allowed' AND profile_id = ?",
-                (name, profile_id),
-            )
-            return cursor.fetchone() is not None
+        ids, names, _ = self._channel_index(profile_id)["allowed"]
+        return (bool(channel_id) and channel_id in ids) or (name is not None and _nocase(name) in names)
 
     def is_channel_blocked(self, name: str, channel_id: str = "",
                            profile_id: str = "default") -> bool:
         """Check if channel is on the blocklist for a profile."""
-        with self._lock:
-            if channel_id:
-                cursor = self.conn.execute(
-                    "SELECT 1 FROM channels WHERE channel_id = ? AND status = 'blocked' AND profile_id = ?",
-                    (channel_id, profile_id),
-                )
-                if cursor.fetchone() is not None:
-                    return True
-            cursor = self.conn.execute(
-                "SELECT 1 FROM channels WHERE channel_name = ? COLLATE NOCASE AND status = 'blocked' AND profile_id = ?",
-                (name, profile_id),
-            )
-            return cursor.fetchone() is not None
+        ids, names, _ = self._channel_index(profile_id)["blocked"]
+        return (bool(channel_id) and channel_id in ids) or (name is not None and _nocase(name) in names)
 
-    def get_channel_handles_set(self, profile_id: str = "default") -> set[str]:
-        """Get lowercased set of all channel handles for a profile."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT handle FROM channels WHERE handle IS NOT NULL AND handle != '' AND profile_id = ?",
-                (profile_id,),
-            )
-            return {row[0].lower() for row in cursor.fetchall()}
+    def get_channel_handles_set(self, profile_id: str = "default") -> frozenset[str]:
+        """Get lowercased set of all channel handles for a profile.
 
-    def get_blocked_channels_set(self, profile_id: str = "default") -> set[str]:
-        """Get set of blocked channel names (lowercased) for a profile."""
+        Cached per profile until a channel list changes.
+        """
+        cached = self._handles_cache.get(profile_id)
+        if cached is not None:
+            return cached
+        gen = self._lookup_gen
+        cursor = self._read_conn().execute(
+            "SELECT handle FROM channels WHERE handle IS NOT NULL AND handle != '' AND profile_id = ?",
+            (profile_id,),
+        )
+        handles = frozenset(row[0].lower() for row in cursor)
         with self._lock:
-            cursor = self.conn.execute(
-                "SELECT channel_name FROM channels WHERE status = 'blocked' AND profile_id = ?",
-                (profile_id,),
-            )
-            return {row[0].lower() for row in cursor.fetchall()}
+            if gen == self._lookup_gen:  # no write landed while we were reading
+                self._handles_cache[profile_id] = handles
+        return handles
+
+    def get_blocked_channels_set(self, profile_id: str = "default") -> frozenset[str]:
+        """Get set of blocked channel names (lowercased) for a profile.
+
+        Cached per profile until a channel list changes.
+        """
+        return self._channel_index(profile_id)["blocked"][2]
 
     # --- Settings ---
 
+    def _settings(self) -> dict[str, str]:
+        """All settings, read from the database once and then kept current by the writers."""
+        cached = self._settings_cache
+        if cached is not None:
+            return cached
+        gen = self._settings_gen
+        cursor = self._read_conn().execute("SELECT key, value FROM settings")
+        settings = dict(cursor.fetchall())
+        with self._lock:
+            if gen == self._settings_gen:  # no write landed while we were reading
+                self._settings_cache = settings
+        return settings
+
+    def _settings_written(self, values: dict[str, str]) -> None:
+        """Apply committed setting writes to the cache (caller holds _lock)."""
+        if self._settings_cache is not None:
+            self._settings_cache.update(values)
+        self._settings_gen += 1
+
     def get_setting(self, key: str, default: str = "") -> str:
         """Read a setting value."""
-        with self._lock:
-            cursor = self.conn.execute(
-                "SELECT value FROM settings WHERE key = ?", (key,)
-            )
-            row = cursor.fetchone()
-            return row[0] if row else default
+        value = self._settings().get(key)
+        return default if value is None else value
+
+    def get_settings(self, keys: list[str]) -> dict[str, str]:
+        """Read several settings at once. Keys with no row are omitted."""
+        settings = self._settings()
+        return {key: settings[key] for key in keys if key in settings}
+
+    def has_any_setting(self, keys: list[str]) -> bool:
+        """Check if any of the given keys holds a non-empty value."""
+        settings = self._settings()
+        return any(settings.get(key) for key in keys)
 
     def set_setting(self, key: str, value: str) -> None:
         """Write a setting (upsert)."""
@@ -1154,54 +1627,82 @@ class VideoStore:
                 (key, value, value),
             )
             self.conn.commit()
+            self._settings_written({key: value})
+
+    def set_settings(self, values: dict[str, str]) -> None:
+        """Write several settings (upsert) in a single transaction."""
+        if not values:
+            return
+        with self._lock:
+            self.conn.executemany(
+                """INSERT INTO settings (key, value) VALUES (?, ?)
+                   ON CONFLICT(key) DO UPDATE SET value = ?, updated_at = datetime('now')""",
+                [(key, value, value) for key, value in values.items()],
+            )
+            self.conn.commit()
+            self._settings_written(values)
 
     # --- Activity report ---
 
     def get_recent_activity(self, days: int = 7, limit: int = 50,
                             profile_id: str = "default") -> list[dict]:
         """Get recent video requests for a profile."""
-        with self._lock:
-            cursor = self.conn.execute(
-                """SELECT video_id, title, channel_name, status, requested_at, view_count
-                   FROM videos
-                   WHERE requested_at >= datetime('now', ?) AND profile_id = ?
-                   ORDER BY requested_at DESC
-                   LIMIT ?""",
-                (f"-{days} days", profile_id, limit),
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        conn = self._read_conn()
+        cursor = conn.execute(
+            """SELECT video_id, title, channel_name, status, requested_at, view_count
+               FROM videos
+               WHERE requested_at >= ? AND profile_id = ?
+               ORDER BY requested_at DESC
+               LIMIT ?""",
+            (_utc_cutoff(days), profile_id, limit),
+        )
+        return _rows_to_dicts(cursor)
 
     # --- Stats ---
 
     def get_stats(self, profile_id: str = "default") -> dict:
         """Get aggregate statistics for a profile."""
-        with self._lock:
-            cursor = self.conn.execute("""
-                SELECT
-                    COUNT(*) as total,
-                    COALESCE(SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END), 0) as pending,
-                    COALESCE(SUM(CASE WHEN status = 'approved' THEN 1 ELSE 0 END), 0) as approved,
-                    COALESCE(SUM(CASE WHEN status = 'denied' THEN 1 ELSE 0 END), 0) as denied,
-                    COALESCE(SUM(view_count), 0) as total_views
-                FROM videos WHERE profile_id = ?
-            """, (profile_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else {"total": 0, "pending": 0, "approved": 0, "denied": 0, "total_views": 0}
+        conn = self._read_conn()
+        # Covered by idx_videos_profile_status_views; totals are summed here
+        cursor = conn.execute(
+            "SELECT status, COUNT(*), COALESCE(SUM(view_count), 0) "
+            "FROM videos WHERE profile_id = ? GROUP BY status",
+            (profile_id,),
+        )
+        stats = {"total": 0, "pending": 0, "approved": 0, "denied": 0, "total_views": 0}
+        for status, count, views in cursor.fetchall():
+            if status in ("pending", "approved", "denied"):
+                stats[status] = count
+            stats["total"] += count
+            stats["total_views"] += views
+        return stats
 
     def prune_old_data(self, watch_days: int = 180, search_days: int = 90) -> tuple[int, int]:
         """Delete watch_log and search_log entries older than N days (global)."""
         with self._lock:
             c1 = self.conn.execute(
-                "DELETE FROM watch_log WHERE watched_at < datetime('now', ?)",
-                (f"-{watch_days} days",),
+                "DELETE FROM watch_log WHERE watched_at < ?",
+                (_utc_cutoff(watch_days),),
             )
             c2 = self.conn.execute(
-                "DELETE FROM search_log WHERE searched_at < datetime('now', ?)",
-                (f"-{search_days} days",),
+                "DELETE FROM search_log WHERE searched_at < ?",
+                (_utc_cutoff(search_days),),
             )
             self.conn.commit()
+            # Refresh planner statistics for tables that changed enough to matter
+            self.conn.execute("PRAGMA optimize")
+            # Pruning rewrites many pages: fold them back and shrink the WAL now
+            self._truncate_wal()
             return c1.rowcount, c2.rowcount
 
     def close(self) -> None:
-        """Close database connection."""
-        self.conn.close()
+        """Stop checkpointing, run PRAGMA optimize, then close all connections."""
+        self._stop_checkpoints.set()
+        self._checkpointer.join(timeout=5)
+        with self._lock:
+            for conn in self._read_conns:
+                conn.close()
+            self._read_conns.clear()
+            self.conn.execute("PRAGMA optimize")
+            self._truncate_wal()
+            self.conn.close()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 
 from i18n.locales.en import TRANSLATIONS as EN_TRANSLATIONS
 from i18n.locales.nb import MONTHS_SHORT as NB_MONTHS_SHORT
@@ -84,18 +85,20 @@ def category_label(category: str, locale: str | None, short: bool = False) -> st
     return t(locale, "Entertainment")
 
 
+_DAY_LABEL_KEYS = {
+    "mon": ("Monday", "Mon"),
+    "tue": ("Tuesday", "Tue"),
+    "wed": ("Wednesday", "Wed"),
+    "thu": ("Thursday", "Thu"),
+    "fri": ("Friday", "Fri"),
+    "sat": ("Saturday", "Sat"),
+    "sun": ("Sunday", "Sun"),
+}
+
+
 def day_label(day: str, locale: str | None, short: bool = False) -> str:
     """Return localized day label from canonical day code."""
-    mapping = {
-        "mon": ("Monday", "Mon"),
-        "tue": ("Tuesday", "Tue"),
-        "wed": ("Wednesday", "Wed"),
-        "thu": ("Thursday", "Thu"),
-        "fri": ("Friday", "Fri"),
-        "sat": ("Saturday", "Sat"),
-        "sun": ("Sunday", "Sun"),
-    }
-    long_key, short_key = mapping.get(day, (day, day.capitalize()[:3]))
+    long_key, short_key = _DAY_LABEL_KEYS.get(day, (day, day.capitalize()[:3]))
     return t(locale, short_key if short else long_key)
 
 
@@ -109,6 +112,7 @@ def _uses_24h(locale: str | None, time_format: str | None) -> bool:
     return normalize_locale(locale) == "nb"
 
 
+@lru_cache(maxsize=512)
 def format_time(hhmm: str | None, locale: str | None, time_format: str | None = None) -> str | None:
     """Locale-aware time formatting with optional explicit time format."""
     if hhmm is None:
@@ -128,6 +132,7 @@ def format_time(hhmm: str | None, locale: str | None, time_format: str | None =
     return f"{display_hour}:{minute:02d} {suffix}"
 
 
+@lru_cache(maxsize=512)
 def format_time_compact(hhmm: str | None, locale: str | None, time_format: str | None = None) -> str | None:
     """Shorter locale-aware time formatting for compact grids."""
     if hhmm is None:
@@ -27,6 +27,10 @@ class _DummyUpdate:
 class _DummyQueryMessage:
     def __init__(self, chat_id: int = 1):
         self.chat_id = chat_id
+        self.replies: list[dict] = []
+
+    async def reply_text(self, **kwargs):
+        self.replies.append(kwargs)
 
 
 class _DummyQuery:
@@ -186,6 +190,7 @@ def test_switch_confirm_keep_clears_inline_buttons(tmp_path):
         assert query.edits
         assert "Beholder gjeldende innstillinger" in query.edits[0]["text"]
         assert query.edits[0]["reply_markup"] is None
+        assert query.edits[0]["parse_mode"] is None
     finally:
         store.close()
 
@@ -206,3 +211,179 @@ def test_revoke_toast_uses_dedicated_localized_key(tmp_path):
         assert query.answers == ["Fjernet!"]
     finally:
         store.close()
+
+
+def test_time_setup_keyboards_are_reused(tmp_path):
+    bot, store = _make_bot(tmp_path)
+    try:
+        _, first = bot._render_setup_mode()
+        _, second = bot._render_setup_mode()
+        assert first is second
+        _, standalone = bot._render_setup_top(onboard=False)
+        _, onboard = bot._render_setup_top(onboard=True)
+        assert standalone is not onboard
+        assert onboard.inline_keyboard[1][0].callback_data == "onboard_time_back"
+    finally:
+        store.close()
+
+
+def test_time_wizard_custom_step_keeps_onboard_state(tmp_path):
+    bot, store = _make_bot(tmp_path)
+    try:
+        bot._pending_wizard[1] = {
+            "step": "setup_top",
+            "profile_id": "kid1",
+            "onboard_return": True,
+            "hub_message_id": 99,
+        }
+        query = _DummyQuery()
+
+        asyncio.run(bot._cb_setup_simple(query, "custom"))
+
+        assert bot._pending_wizard[1] == {
+            "step": "setup_simple",
+            "profile_id": "kid1",
+            "onboard_return": True,
+            "hub_message_id": 99,
+        }
+        assert query.message.replies
+    finally:
+        store.close()
+
+
+def test_wizard_reply_dispatches_day_stop(tmp_path):
+    bot, store = _make_bot(tmp_path)
+    try:
+        bot._pending_wizard[-100123456] = {"step": "setup_daystop:sat", "profile_id": "default"}
+        update = _DummyUpdate("9pm", chat_id=-100123456)
+
+        asyncio.run(bot._handle_wizard_reply(update, None))
+
+        assert store.get_setting("default:sat_schedule_end") == "21:00"
+        assert -100123456 not in bot._pending_wizard
+        assert update.message.replies[0][1]["reply_markup"] is not None
+    finally:
+        store.close()
+
+
+def test_wizard_reply_ignores_text_on_button_steps(tmp_path):
+    bot, store = _make_bot(tmp_path)
+    try:
+        bot._pending_wizard[-100123456] = {"step": "setup_top", "profile_id": "default"}
+        update = _DummyUpdate("30", chat_id=-100123456)
+
+        asyncio.run(bot._handle_wizard_reply(update, None))
+
+        assert bot._pending_wizard[-100123456]["step"] == "setup_top"
+        assert update.message.replies == []
+    finally:
+        store.close()
+
+
+def test_onboard_wizard_summary_includes_time_submenu(tmp_path):
+    bot, store = _make_bot(tmp_path)
+    try:
+        bot._pending_wizard[-100123456] = {
+            "step": "setup_simple",
+            "profile_id": "default",
+            "onboard_return": True,
+        }
+        update = _DummyUpdate("45", chat_id=-100123456)
+
+        asyncio.run(bot._handle_wizard_reply(update, None))
+
+        assert len(update.message.replies) == 1
+        text, kwargs = update.message.replies[0]
+        assert "45" in text
+        assert "Tidsgrenser" in text
+        assert kwargs["reply_markup"] is not None
+    finally:
+        store.close()
+
+
+def test_day_grid_marks_overridden_days(tmp_path):
+    bot, store = _make_bot(tmp_path)
+    try:
+        cs = bot._child_store("default")
+        _, plain = bot._setup_sched_day_grid(store=cs)
+        assert not any("•" in b.text for row in plain.inline_keyboard for b in row)
+
+        cs.set_setting("sat_schedule_end", "22:00")
+        _, marked = bot._setup_sched_day_grid(store=cs)
+        assert marked is not plain
+        assert marked.inline_keyboard[1][1].text.endswith("•")
+        assert bot._setup_sched_day_grid(store=cs)[1] is marked
+    finally:
+        store.close()
+
+
+def test_switch_confirm_parses_category_payload(tmp_path):
+    bot, store = _make_bot(tmp_path)
+    try:
+        store.set_setting("kid1:daily_limit_minutes", "60")
+        query = _DummyQuery()
+
+        asyncio.run(bot._cb_switch_confirm(query, "kid1:category:edu:45"))
+        asyncio.run(bot._cb_switch_confirm(query, "kid1:category:bogus:45"))
+
+        assert store.get_setting("kid1:edu_limit_minutes") == "45"
+        assert store.get_setting("kid1:daily_limit_minutes") == "0"
+        assert store.get_setting("kid1:bogus_limit_minutes") == ""
+        assert len(query.edits) == 1
+    finally:
+        store.close()
+
+
+def test_wizard_store_reuses_child_store(tmp_path):
+    bot, store = _make_bot(tmp_path)
+    try:
+        bot._pending_wizard[1] = {"step": "setup_top", "profile_id": "kid1"}
+        ws = bot._wizard_store(1)
+        assert ws.profile_id == "kid1"
+        assert bot._wizard_store(1) is ws
+        assert bot._wizard_store(2).profile_id == "default"
+    finally:
+        store.close()
+
+
+def test_check_admin_matches_chat_or_user(tmp_path):
+    bot, store = _make_bot(tmp_path)
+    try:
+        def _update(chat_id, user_id):
+            return type("U", (), {
+                "effective_chat": type("Chat", (), {"id": chat_id})(),
+                "effective_user": type("User", (), {"id": user_id})(),
+            })()
+
+        assert bot._check_admin(_update(-100123456, 5)) is True
+        assert bot._check_admin(_update(5, -100123456)) is True
+        assert bot._check_admin(_update(5, 6)) is False
+    finally:
+        store.close()
+
+
+def test_wizard_double_tap_runs_once(tmp_path):
+    bot, store = _make_bot(tmp_path)
+    try:
+        query = _DummyQuery()
+        query.message.message_id = 7
+        query.data = "setup_mode:simple"
+        calls = []
+
+        async def _step():
+            calls.append(1)
+            await asyncio.sleep(0)
+
+        async def _run():
+            await asyncio.gather(
+                bot._run_wizard_callback(query, _step),
+                bot._run_wizard_callback(query, _step),
+            )
+            await bot._run_wizard_callback(query, _step)
+
+        asyncio.run(_run())
+
+        assert len(calls) == 2
+        assert not bot._wizard_taps
+    finally:
+        store.close()
@@ -42,6 +42,29 @@ class TestChildStoreSettings:
         assert cs1.get_setting("limit") == "60"
         assert cs2.get_setting("limit") == "120"
 
+    def test_has_any_setting_prefixed(self, video_store):
+        video_store.set_setting("mon_schedule_start", "08:00")  # Unprefixed
+        cs = ChildStore(video_store, "kid1")
+        assert cs.has_any_setting(["mon_schedule_start"]) is False
+        cs.set_setting("mon_schedule_start", "09:00")
+        assert cs.has_any_setting(["mon_schedule_start"]) is True
+
+    def test_has_any_setting_default_falls_back(self, video_store):
+        video_store.set_setting("sun_daily_limit_minutes", "30")
+        cs = ChildStore(video_store, "default")
+        assert cs.has_any_setting(["sun_daily_limit_minutes"]) is True
+
+    def test_bulk_settings_prefixed_with_fallback(self, video_store):
+        video_store.set_setting("schedule_start", "08:00")  # Unprefixed
+        cs = ChildStore(video_store, "default")
+        cs.set_settings({"schedule_end": "20:00"})
+        assert video_store.get_setting("default:schedule_end") == "20:00"
+        assert cs.get_settings(["schedule_start", "schedule_end", "missing"]) == {
+            "schedule_start": "08:00",
+            "schedule_end": "20:00",
+        }
+        assert ChildStore(video_store, "kid1").get_settings(["schedule_start"]) == {}
+
 
 class TestChildStoreVideoDelegation:
     def test_add_and_get_video(self, video_store):
@@ -108,6 +131,19 @@ class TestChildStoreGetattr:
         result = cs.prune_old_data()
         assert result == (0, 0)
 
+    def test_curried_methods_defined_on_class(self, video_store):
+        cs = ChildStore(video_store, "kid1")
+        cs.add_channel("BoundCh", "allowed")
+        assert "get_channels" in ChildStore.__dict__
+        assert cs.get_channels("allowed") == ["BoundCh"]
+        assert cs.get_channels is cs.get_channels  # bound once per instance
+        assert ChildStore(video_store, "kid2").get_channels("allowed") == []
+
+    def test_slots_reject_new_attributes(self, video_store):
+        cs = ChildStore(video_store, "kid1")
+        with pytest.raises(AttributeError):
+            cs.extra = 1
+
     def test_profile_id_attribute(self, video_store):
         cs = ChildStore(video_store, "kid1")
         assert cs.profile_id == "kid1"
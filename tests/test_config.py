@@ -3,7 +3,7 @@
 import os
 import pytest
 
-from config import AppConfig, Config, expand_env_vars, load_config, WebConfig
+from config import AppConfig, Config, expand_env_vars, load_config, WebConfig, _expand_env_inplace
 
 
 class TestExpandEnvVars:
@@ -29,6 +29,33 @@ class TestExpandEnvVars:
         result = expand_env_vars(["${ITEM}", "literal"])
         assert result == ["x", "literal"]
 
+    def test_mixed_syntax_in_one_string(self, monkeypatch):
+        monkeypatch.setenv("HOST", "example.org")
+        monkeypatch.setenv("PORT", "8080")
+        assert expand_env_vars("http://${HOST}:$PORT/") == "http://example.org:8080/"
+
+    def test_expanded_value_not_rescanned(self, monkeypatch):
+        monkeypatch.setenv("SECRET", "pa$HOME")
+        assert expand_env_vars("${SECRET}") == "pa$HOME"
+
+    def test_unchanged_containers_keep_identity(self, monkeypatch):
+        monkeypatch.setenv("TOKEN", "abc123")
+        plain = {"host": "0.0.0.0", "ports": [1, 2]}
+        assert expand_env_vars(plain) is plain
+        tree = {"web": plain, "bot": {"token": "${TOKEN}"}}
+        result = expand_env_vars(tree)
+        assert result == {"web": plain, "bot": {"token": "abc123"}}
+        assert result["web"] is plain
+        assert tree["bot"]["token"] == "${TOKEN}"
+
+    def test_inplace_expansion_updates_containers(self, monkeypatch):
+        monkeypatch.setenv("TOKEN", "abc123")
+        tree = {"bot": {"token": "${TOKEN}"}, "hosts": ["$TOKEN", 1]}
+        bot, hosts = tree["bot"], tree["hosts"]
+        assert _expand_env_inplace(tree) is tree
+        assert tree == {"bot": {"token": "abc123"}, "hosts": ["abc123", 1]}
+        assert tree["bot"] is bot and tree["hosts"] is hosts
+
     def test_non_string_passthrough(self):
         assert expand_env_vars(42) == 42
         assert expand_env_vars(True) is True
@@ -69,6 +96,13 @@ watch_limits:
         assert cfg.telegram.bot_token == "env_token_val"
         assert cfg.telegram.admin_chat_id == "77777"
 
+    def test_empty_yaml_uses_defaults(self, tmp_path):
+        cfg_file = tmp_path / "empty.yaml"
+        cfg_file.write_text("")
+        assert Config.from_yaml(cfg_file) == Config()
+        cfg_file.write_text("# nothing configured yet\n")
+        assert Config.from_yaml(cfg_file) == Config()
+
 
 class TestAppConfig:
     def test_log_level_default(self):
@@ -142,6 +176,17 @@ class TestConfigFromEnv:
         assert cfg.web.port == 9090
         assert cfg.telegram.bot_token == "test_token"
 
+    def test_from_env_coerces_field_types(self, monkeypatch):
+        monkeypatch.setenv("BRG_SHORTS_ENABLED", "TRUE")
+        monkeypatch.setenv("BRG_NOTIFY_ON_LIMIT", "no")
+        monkeypatch.setenv("BRG_CHANNEL_CACHE_TTL", "60")
+        monkeypatch.delenv("BRG_DB_PATH", raising=False)
+        cfg = Config.from_env()
+        assert cfg.youtube.shorts_enabled is True
+        assert cfg.watch_limits.notify_on_limit is False
+        assert cfg.youtube.channel_cache_ttl == 60
+        assert cfg.database.path == "db/videos.db"
+
 
 class TestLoadConfig:
     def test_load_from_path(self, config_yaml):
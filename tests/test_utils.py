@@ -14,6 +14,7 @@ from utils import (
     get_day_utc_bounds,
     get_weekday,
     get_today_str,
+    load_yaml,
     DAY_NAMES,
 )
 
@@ -62,6 +63,8 @@ class TestParseTimeInput:
         "13am",
         "13pm",
         "0",
+        "8",
+        "8:am",
         "12345",
     ])
     def test_invalid_inputs(self, raw):
@@ -291,3 +294,20 @@ class TestGetBonusMinutes:
         store = MagicMock()
         store.get_setting = lambda k, d="": {"daily_bonus_date": "2024-01-15", "daily_bonus_minutes": ""}.get(k, d)
         assert get_bonus_minutes(store, "2024-01-15") == 0
+
+
+class TestLoadYaml:
+    def test_each_call_returns_its_own_document(self, tmp_path):
+        f = tmp_path / "a.yaml"
+        f.write_text("key: 1\n")
+        first = load_yaml(f)
+        assert first == {"key": 1}
+        first["key"] = 2
+        assert load_yaml(str(f)) == {"key": 1}
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        f = tmp_path / "a.yaml"
+        f.write_text("key: 1\n")
+        load_yaml(f)
+        f.write_text("key: 22\n")
+        assert load_yaml(f) == {"key": 22}
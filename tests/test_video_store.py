@@ -1,5 +1,8 @@
 """Tests for data/video_store.py — CRUD, channels, profiles, settings, watch tracking."""
 
+import sqlite3
+import threading
+
 import pytest
 
 from data.video_store import VideoStore
@@ -20,6 +23,16 @@ class TestVideoStoreVideoCRUD:
         v2 = video_store.add_video("abc12345678", "Different Title", "Channel")
         assert v2["title"] == "Original"  # INSERT OR IGNORE keeps original
 
+    def test_add_without_channel_name_is_skipped(self, video_store):
+        assert video_store.add_video("nochan12345", "Title", None) is None
+        assert video_store.get_video("nochan12345") is None
+
+    def test_add_duplicate_writes_nothing(self, video_store):
+        video_store.add_video("abc12345678", "Original", "Channel")
+        changes = video_store.conn.total_changes
+        video_store.add_video("abc12345678", "Different Title", "Channel")
+        assert video_store.conn.total_changes == changes
+
     def test_get_nonexistent_returns_none(self, video_store):
         assert video_store.get_video("nonexistent1") is None
 
@@ -42,6 +55,16 @@ class TestVideoStoreVideoCRUD:
         )
         assert v["thumbnail_url"] is None  # Invalid host → stripped
 
+    @pytest.mark.parametrize("url, expected", [
+        ("https://i.ytimg.com/vi/x/hq.jpg", "https://i.ytimg.com/vi/x/hq.jpg"),
+        ("https://I.YTIMG.COM/vi/x/hq.jpg", "https://I.YTIMG.COM/vi/x/hq.jpg"),  # urlparse fallback
+        ("http://i.ytimg.com/vi/x/hq.jpg", None),
+        ("https://i.ytimg.com.evil.com/x.jpg", None),
+    ])
+    def test_validate_thumbnail_url(self, url, expected):
+        from data.video_store import _validate_thumbnail_url
+        assert _validate_thumbnail_url(url) == expected
+
     def test_update_status(self, video_store):
         video_store.add_video("stat1234567", "Status Test", "Ch")
         assert video_store.update_status("stat1234567", "approved") is True
@@ -91,6 +114,16 @@ class TestVideoStoreVideoCRUD:
 
         assert [video["video_id"] for video in approved] == ["req__123456"]
 
+    def test_get_approved_page(self, video_store):
+        for i in range(5):
+            video_store.add_video(f"page{i:07d}", f"P{i}", "Ch")
+            video_store.update_status(f"page{i:07d}", "approved")
+        videos, total = video_store.get_approved_page(page=1, page_size=2)
+        assert total == 5
+        assert len(videos) == 2
+        assert "total_count" not in videos[0]
+        assert video_store.get_approved_page(page=9, page_size=2) == ([], 5)
+
     def test_find_video_fuzzy(self, video_store):
         video_store.add_video("a-b_c-d-e-f", "Fuzzy", "Ch")
         # Hyphens encoded as underscores
@@ -108,6 +141,23 @@ class TestVideoStoreVideoCRUD:
         assert len(results) == 1
         assert results[0]["title"] == "Dinosaur Adventures"
 
+    def test_search_approved_substring_channel_and_short_queries(self, video_store):
+        video_store.add_video("srchsub1234", "Minecraft Builds", "BlockWorld")
+        video_store.update_status("srchsub1234", "approved")
+        video_store.add_video("srchpen1234", "Minecraft Pending", "Ch")
+
+        assert [v["video_id"] for v in video_store.search_approved("CRAFT")] == ["srchsub1234"]
+        assert [v["video_id"] for v in video_store.search_approved("blockw")] == ["srchsub1234"]
+        assert [v["video_id"] for v in video_store.search_approved("Mi")] == ["srchsub1234"]  # LIKE path
+        assert video_store.search_approved("creeper") == []
+
+    def test_search_index_follows_deletes(self, video_store):
+        video_store.add_video("srchdel1234", "Volcano Facts", "Ch")
+        video_store.update_status("srchdel1234", "approved")
+        assert video_store.search_approved("volcano")
+        video_store.delete_channel_videos("Ch")
+        assert video_store.search_approved("volcano") == []
+
     def test_get_denied_video_ids(self, video_store):
         video_store.add_video("deny1234567", "Denied", "Ch")
         video_store.update_status("deny1234567", "denied")
@@ -144,6 +194,18 @@ class TestVideoStoreProfiles:
     def test_get_profile_by_empty_pin(self, video_store):
         assert video_store.get_profile_by_pin("") is None
 
+    def test_profile_lookups_follow_updates(self, video_store):
+        video_store.create_profile("pc", "Cached", pin="1234")
+        video_store.get_profile("pc")["display_name"] = "mutated"  # copies are handed out
+        assert video_store.get_profile("pc")["display_name"] == "Cached"
+        video_store.update_profile("pc", pin="4321")
+        assert video_store.get_profile_by_pin("1234") is None
+        assert video_store.get_profile_by_pin("4321")["id"] == "pc"
+        assert video_store.get_profile_by_pin("ünï") is None
+        video_store.delete_profile("pc")
+        assert video_store.get_profile("pc") is None
+        assert video_store.get_profiles() == []
+
     def test_update_profile(self, video_store):
         video_store.create_profile("upd", "Original")
         video_store.update_profile("upd", display_name="Updated")
@@ -167,6 +229,17 @@ class TestVideoStoreProfiles:
         assert video_store.get_profile("del") is None
         assert video_store.get_video("delvid12345", profile_id="del") is None
         assert video_store.get_channels("allowed", profile_id="del") == []
+        assert video_store.get_setting("del:some_key") == ""
+
+    def test_delete_profile_keeps_other_profiles_settings(self, video_store):
+        video_store.create_profile("a_b", "Underscore")
+        video_store.set_setting("a_b:limit", "30")
+        video_store.set_setting("axb:limit", "45")  # would match LIKE 'a_b:%'
+        video_store.set_setting("a_bc:limit", "60")
+        assert video_store.delete_profile("a_b") is True
+        assert video_store.get_setting("a_b:limit") == ""
+        assert video_store.get_setting("axb:limit") == "45"
+        assert video_store.get_setting("a_bc:limit") == "60"
 
     def test_video_isolation_between_profiles(self, video_store):
         video_store.create_profile("p1", "Profile 1")
@@ -268,6 +341,15 @@ class TestVideoStoreChannels:
         assert video_store.resolve_channel_name("@resolved") == "Resolved"
         assert video_store.resolve_channel_name("Resolved") == "Resolved"
 
+    def test_handle_lookups_are_case_insensitive_and_scoped(self, video_store):
+        video_store.add_channel("Scoped", "allowed", handle="@Scoped")
+        video_store.add_channel("Scoped", "allowed", handle="@Scoped", profile_id="other")
+        assert video_store.resolve_channel_name("@scoped") == "Scoped"
+        assert video_store.set_channel_category("@SCOPED", "edu") is True
+        assert video_store.get_channel_category("Scoped", profile_id="other") is None
+        assert video_store.remove_channel("@scoped") is True
+        assert video_store.resolve_channel_name("@scoped", profile_id="other") == "Scoped"
+
     def test_channel_handle_set(self, video_store):
         video_store.add_channel("Ch1", "allowed", handle="@ch1")
         video_store.add_channel("Ch2", "allowed", handle="@ch2")
@@ -275,6 +357,25 @@ class TestVideoStoreChannels:
         assert "@ch1" in handles
         assert "@ch2" in handles
 
+    def test_channels_missing_handles_and_ids(self, video_store):
+        video_store.add_channel("Full", "allowed", channel_id="UCfull", handle="@full")
+        video_store.add_channel("NoHandle", "allowed", channel_id="UCnohandle")
+        video_store.add_channel("NoId", "allowed", handle="@noid")
+        video_store.add_channel("Blank", "blocked", channel_id="", handle="")
+        assert sorted(video_store.get_channels_missing_handles()) == [
+            ("Blank", ""), ("NoHandle", "UCnohandle")]
+        assert sorted(video_store.get_channels_missing_ids()) == [("Blank", ""), ("NoId", "@noid")]
+        video_store.update_channel_id("NoId", "UCnoid")
+        video_store.update_channel_handle("NoHandle", "@nohandle")
+        assert video_store.get_channels_missing_ids() == [("Blank", "")]
+        assert video_store.get_channels_missing_handles() == [("Blank", "")]
+
+    def test_channel_handle_set_follows_handle_updates(self, video_store):
+        video_store.add_channel("NoHandle", "allowed")
+        assert video_store.get_channel_handles_set() == frozenset()
+        video_store.update_channel_handle("NoHandle", "@NoHandle")
+        assert video_store.get_channel_handles_set() == {"@nohandle"}
+
     def test_blocked_channels_set(self, video_store):
         video_store.add_channel("BlockedA", "blocked")
         video_store.add_channel("AllowedB", "allowed")
@@ -282,6 +383,55 @@ class TestVideoStoreChannels:
         assert "blockeda" in blocked
         assert "allowedb" not in blocked
 
+    def test_channel_status_checks_follow_writes(self, video_store):
+        assert video_store.is_channel_allowed("Later", channel_id="UClater") is False  # warm cache
+        video_store.add_channel("Later", "allowed")
+        assert video_store.is_channel_allowed("later") is True
+        assert video_store.is_channel_allowed("Renamed", channel_id="UClater") is False
+        video_store.update_channel_id("Later", "UClater")
+        assert video_store.is_channel_allowed("Renamed", channel_id="UClater") is True
+        video_store.add_channel("Later", "blocked")
+        assert video_store.is_channel_allowed("Later") is False
+        assert video_store.is_channel_blocked("Renamed", channel_id="UClater") is True
+        assert video_store.is_channel_blocked("Later", profile_id="other") is False
+
+    def test_channel_status_checks_fold_case_like_nocase(self, video_store):
+        # NOCASE folds ASCII letters only, so "É" and "é" stay distinct
+        video_store.add_channel("ÉCOLE", "blocked")
+        assert video_store.is_channel_blocked("École") is True
+        assert video_store.is_channel_blocked("école") is False
+        assert video_store.remove_channel("école") is False
+        assert video_store.remove_channel("École") is True
+        assert video_store.is_channel_blocked("École") is False
+
+    def test_channel_status_checks_without_name(self, video_store):
+        video_store.add_channel("Known", "allowed", channel_id="UCknown")
+        video_store.add_channel("Bad", "blocked")
+        assert video_store.is_channel_allowed(None) is False
+        assert video_store.is_channel_blocked(None) is False
+        assert video_store.is_channel_allowed(None, channel_id="UCknown") is True
+
+    def test_blocked_channels_set_cached_until_change(self, video_store):
+        video_store.add_channel("BlockedA", "blocked")
+        first = video_store.get_blocked_channels_set()
+        assert video_store.get_blocked_channels_set() is first
+        video_store.add_channel("BlockedB", "blocked")
+        assert "blockedb" in video_store.get_blocked_channels_set()
+        video_store.remove_channel("BlockedA")
+        assert "blockeda" not in video_store.get_blocked_channels_set()
+
+    def test_add_channels_bulk(self, video_store):
+        video_store.add_channel("Existing", "allowed", channel_id="UCold")
+        written = video_store.add_channels([
+            {"name": "Existing", "status": "blocked"},
+            {"name": "Fresh", "status": "allowed", "handle": "@fresh", "category": "edu"},
+        ])
+        assert written == 2
+        assert video_store.is_channel_blocked("Existing") is True
+        assert video_store.get_channel_category("Fresh") == "edu"
+        assert "existing" in video_store.get_blocked_channels_set()
+        assert video_store.add_channels([]) == 0
+
     def test_channel_isolation_between_profiles(self, video_store):
         video_store.create_profile("cp1", "CP1")
         video_store.create_profile("cp2", "CP2")
@@ -305,6 +455,40 @@ class TestVideoStoreSettings:
         video_store.set_setting("key", "v2")
         assert video_store.get_setting("key") == "v2"
 
+    def test_has_any_setting(self, video_store):
+        assert video_store.has_any_setting([]) is False
+        assert video_store.has_any_setting(["mon_schedule_start"]) is False
+        video_store.set_setting("tue_schedule_end", "")  # cleared override
+        assert video_store.has_any_setting(["mon_schedule_start", "tue_schedule_end"]) is False
+        video_store.set_setting("tue_schedule_end", "20:00")
+        assert video_store.has_any_setting(["mon_schedule_start", "tue_schedule_end"]) is True
+
+    def test_bulk_settings(self, video_store):
+        assert video_store.get_settings([]) == {}
+        video_store.set_settings({"a": "1", "b": "2"})
+        video_store.set_settings({"b": "3"})
+        assert video_store.get_settings(["a", "b", "missing"]) == {"a": "1", "b": "3"}
+
+    def test_settings_cache_tracks_writes(self, tmp_path):
+        db = str(tmp_path / "settings.db")
+        store = VideoStore(db_path=db)
+        try:
+            assert store.get_setting("limit") == ""  # loads the cache
+            store.set_setting("limit", "30")
+            store.set_settings({"kid:limit": "45", "kid:edu": "10"})
+            assert store.get_setting("limit") == "30"
+            assert store.get_settings(["kid:limit", "kid:edu"]) == {"kid:limit": "45", "kid:edu": "10"}
+            store.create_profile("kid", "Kid")
+            store.delete_profile("kid")
+            assert store.get_settings(["kid:limit", "kid:edu", "limit"]) == {"limit": "30"}
+        finally:
+            store.close()
+        reopened = VideoStore(db_path=db)
+        try:
+            assert reopened.get_setting("limit") == "30"
+        finally:
+            reopened.close()
+
 
 class TestVideoStoreWatchTracking:
     def test_record_and_get_watch_seconds(self, video_store):
@@ -322,6 +506,71 @@ class TestVideoStoreWatchTracking:
         minutes = video_store.get_daily_watch_minutes(today)
         assert minutes == 10.0
 
+    def test_daily_watch_minutes_date_window(self, video_store):
+        for watched_at in ("2024-02-28 23:59:59", "2024-02-29 00:00:00",
+                           "2024-02-29 23:59:59", "2024-03-01 00:00:00"):
+            video_store.conn.execute(
+                "INSERT INTO watch_log (video_id, duration, watched_at) VALUES (?, ?, ?)",
+                ("win_1234567", 60, watched_at),
+            )
+        video_store.conn.commit()
+        assert video_store.get_daily_watch_minutes("2024-02-29") == 2.0
+        assert video_store.get_daily_watch_minutes(
+            "2024-02-29", utc_bounds=("2024-02-28 23:00:00", "2024-02-29 23:00:00")) == 2.0
+
+    def test_get_daily_watch_by_category(self, video_store):
+        from datetime import datetime, timezone
+        video_store.add_channel("FunCh", "allowed", channel_id="UCfun", category="fun")
+        video_store.add_video("cat_edu1234", "Edu", "Ch")
+        video_store.set_video_category("cat_edu1234", "edu")
+        video_store.add_video("cat_fun1234", "Fun", "FunCh", channel_id="UCfun")
+        video_store.add_video("cat_none123", "None", "Ch")
+        for _ in range(3):
+            video_store.record_watch_seconds("cat_edu1234", 60)
+        video_store.record_watch_seconds("cat_fun1234", 120)
+        video_store.record_watch_seconds("cat_none123", 30)
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        assert video_store.get_daily_watch_by_category(today) == {
+            "edu": 3.0, "fun": 2.0, None: 0.5,
+        }
+
+    def test_daily_watch_by_category_with_shared_channel_id(self, video_store):
+        from datetime import datetime, timezone
+        video_store.add_channel("Chan", "allowed", channel_id="UC1", category="edu")
+        video_store.add_channel("Chan Old Name", "allowed", channel_id="UC1", category="fun")
+        video_store.add_video("shr_1234567", "Shared", "Chan", channel_id="UC1")
+        video_store.record_watch_seconds("shr_1234567", 60)
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        usage = video_store.get_daily_watch_by_category(today)
+        assert sum(usage.values()) == 1.0
+        assert len(usage) == 1
+
+    def test_get_daily_watch_breakdown(self, video_store):
+        from datetime import datetime, timezone
+        video_store.add_channel("FunCh", "allowed", channel_id="UCfun", category="fun")
+        video_store.add_video("brk_fun1234", "Fun", "FunCh", channel_id="UCfun")
+        video_store.record_watch_seconds("brk_fun1234", 60)
+        video_store.record_watch_seconds("brk_fun1234", 60)
+        video_store.record_watch_seconds("brk_gone123", 300)  # video since removed
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        gone, fun = video_store.get_daily_watch_breakdown(today)
+        assert (gone["video_id"], gone["minutes"], gone["title"], gone["category"]) == \
+            ("brk_gone123", 5.0, "brk_gone123", None)
+        assert (fun["video_id"], fun["minutes"], fun["title"], fun["category"]) == \
+            ("brk_fun1234", 2.0, "Fun", "fun")
+
+    def test_daily_watch_breakdown_with_shared_channel_id(self, video_store):
+        from datetime import datetime, timezone
+        video_store.add_channel("Chan", "allowed", channel_id="UC1", category="edu")
+        video_store.add_channel("Chan Old Name", "allowed", channel_id="UC1", category="fun")
+        video_store.add_video("shr_1234567", "Shared", "Chan", channel_id="UC1")
+        video_store.record_watch_seconds("shr_1234567", 60)
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        [entry] = video_store.get_daily_watch_breakdown(today)
+        assert entry["video_id"] == "shr_1234567"
+        assert entry["minutes"] == 1.0
+        assert entry["category"] in ("edu", "fun")
+
     def test_batch_watch_minutes(self, video_store):
         video_store.add_video("bat_1234567", "Batch1", "Ch")
         video_store.add_video("bat_2345678", "Batch2", "Ch")
@@ -388,6 +637,14 @@ class TestVideoStoreWatchTracking:
         assert total == 3
         assert [video["video_id"] for video in page] == ["pagedhist1"]
 
+    def test_record_heartbeat(self, video_store):
+        video_store.add_video("hbeat123456", "Heartbeat", "Ch", duration=300)
+        video_store.record_heartbeat("hbeat123456", 30, 42)
+        video_store.record_heartbeat("hbeat123456", 0, None)  # nothing to write
+        video_store.record_heartbeat("hbeat123456", 30)
+        assert video_store.get_video_watch_minutes("hbeat123456") == 1.0
+        assert video_store.get_video("hbeat123456")["resume_seconds"] == 42
+
 
 class TestVideoStoreSearch:
     def test_update_playback_position(self, video_store):
@@ -426,6 +683,18 @@ class TestVideoStoreWordFilters:
         filters = video_store.get_word_filters_set()
         assert "word" in filters  # Lowercased
 
+    def test_add_word_filters_bulk(self, video_store):
+        video_store.add_word_filter("old")
+        assert video_store.add_word_filters(["OLD", "new", "Other", "new"]) == 2
+        assert video_store.get_word_filters_set() == {"old", "new", "other"}
+
+    def test_word_filters_set_cached_until_change(self, video_store):
+        video_store.add_word_filter("one")
+        first = video_store.get_word_filters_set()
+        assert video_store.get_word_filters_set() is first
+        video_store.remove_word_filter("one")
+        assert "one" not in video_store.get_word_filters_set()
+
 
 class TestVideoStoreStats:
     def test_get_stats(self, video_store):
@@ -437,6 +706,17 @@ class TestVideoStoreStats:
         assert stats["approved"] == 1
         assert stats["pending"] == 1
 
+    def test_get_stats_empty_and_views(self, video_store):
+        assert video_store.get_stats() == {
+            "total": 0, "pending": 0, "approved": 0, "denied": 0, "total_views": 0,
+        }
+        video_store.add_video("sv__1234567", "V1", "Ch")
+        video_store.update_status("sv__1234567", "denied")
+        video_store.record_view("sv__1234567")
+        stats = video_store.get_stats()
+        assert stats["denied"] == 1
+        assert stats["total_views"] == 1
+
 
 class TestVideoStorePrune:
     def test_prune_returns_counts(self, video_store):
@@ -444,7 +724,104 @@ class TestVideoStorePrune:
         assert w == 0 and s == 0
 
 
+class TestVideoStoreConnection:
+    def test_pragmas(self, video_store):
+        def pragma(name):
+            return video_store.conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("temp_store") == 2  # MEMORY
+        assert pragma("cache_size") == -65536
+        assert pragma("wal_autocheckpoint") == 0
+        assert pragma("busy_timeout") == 5000
+
+    def test_reads_use_per_thread_connection(self, video_store):
+        video_store.add_video("thr_1234567", "Threaded", "Ch")
+        seen = {}
+
+        def _read():
+            seen["video"] = video_store.get_video("thr_1234567")
+            seen["conn"] = video_store._read_conn()
+
+        t = threading.Thread(target=_read)
+        t.start()
+        t.join()
+        assert seen["video"]["title"] == "Threaded"
+        assert seen["conn"] is not video_store._read_conn()
+        assert seen["conn"] is not video_store.conn
+
+    def test_read_connection_is_query_only(self, video_store):
+        with pytest.raises(sqlite3.OperationalError):
+            video_store._read_conn().execute("DELETE FROM videos")
+
+    def test_opens_pre_profile_database(self, tmp_path):
+        db = tmp_path / "legacy.db"
+        conn = sqlite3.connect(str(db))
+        conn.executescript("""
+            CREATE TABLE videos (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, video_id TEXT NOT NULL UNIQUE,
+                title TEXT NOT NULL, channel_name TEXT NOT NULL, thumbnail_url TEXT,
+                duration INTEGER, status TEXT NOT NULL DEFAULT 'pending',
+                requested_at TEXT NOT NULL DEFAULT (datetime('now')), decided_at TEXT,
+                view_count INTEGER DEFAULT 0, last_viewed_at TEXT
+            );
+            CREATE TABLE watch_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, video_id TEXT NOT NULL,
+                duration INTEGER NOT NULL, watched_at TEXT NOT NULL DEFAULT (datetime('now'))
+            );
+            CREATE INDEX idx_watch_log_date ON watch_log(watched_at);
+            INSERT INTO videos (video_id, title, channel_name) VALUES ('old12345678', 'Old', 'Ch');
+        """)
+        conn.close()
+        store = VideoStore(db_path=str(db))
+        try:
+            assert store.get_video("old12345678")["profile_id"] == "default"
+            names = {row[0] for row in store.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'")}
+            assert "idx_watch_log_date_cov" in names
+            assert "idx_watch_log_date" not in names
+        finally:
+            store.close()
+
+    def test_migrates_key_tables_to_without_rowid(self, tmp_path):
+        db = tmp_path / "rowid.db"
+        conn = sqlite3.connect(str(db))
+        conn.executescript("""
+            CREATE TABLE settings (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL,
+                updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+            );
+            CREATE TABLE word_filters (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                word TEXT NOT NULL UNIQUE COLLATE NOCASE,
+                added_at TEXT NOT NULL DEFAULT (datetime('now'))
+            );
+            INSERT INTO settings (key, value) VALUES ('daily_limit_minutes', '90');
+            INSERT INTO word_filters (word) VALUES ('spoiler');
+        """)
+        conn.close()
+        store = VideoStore(db_path=str(db))
+        try:
+            assert store._is_without_rowid("settings")
+            assert store._is_without_rowid("word_filters")
+            assert store.get_setting("daily_limit_minutes") == "90"
+            assert store.get_word_filters() == ["spoiler"]
+            assert store.add_word_filter("SPOILER") is False
+        finally:
+            store.close()
+
+
 class TestVideoStoreClose:
     def test_close(self, tmp_path):
         store = VideoStore(db_path=str(tmp_path / "close_test.db"))
         store.close()  # Should not raise
+
+    def test_close_stops_checkpointer_and_truncates_wal(self, tmp_path):
+        db = tmp_path / "wal_test.db"
+        store = VideoStore(db_path=str(db))
+        store.add_video("wal_1234567", "WAL", "Ch")
+        store.close()
+        assert not store._checkpointer.is_alive()
+        wal = tmp_path / "wal_test.db-wal"
+        assert not wal.exists() or wal.stat().st_size == 0
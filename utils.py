@@ -3,9 +3,19 @@
 import logging
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import yaml
 
 from i18n import format_time as locale_format_time, normalize_locale, t
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
@@ -13,6 +23,19 @@ DAY_GROUPS = {"weekdays": DAY_NAMES[:5], "weekend": DAY_NAMES[5:]}
 CAT_LABELS = {"edu": "Educational", "fun": "Entertainment"}
 
 
+def load_yaml(path: Path | str) -> Any:
+    """Parse a YAML file with the safe loader (libyaml's when available).
+
+    Each call returns a fresh document; callers that reload a file often
+    cache the result themselves (see data.starter_channels).
+    """
+    path = Path(path)
+    if path.stat().st_size == 0:
+        return None  # what yaml.load gives for an empty document
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def get_weekday(tz_name: str = "") -> str:
     """Get today's short day name (mon-sun) in the given timezone.
 
@@ -27,14 +50,11 @@ def get_weekday(tz_name: str = "") -> str:
             logger.warning("Invalid timezone %r, falling back to UTC", tz_name)
     return DAY_NAMES[datetime.now(timezone.utc).weekday()]
 
-# Matches: 800, 0800, 8:00, 800am, 8:00am, 800pm, 8:00PM, 2000, 20:00
+# Matches: 800, 0800, 8:00, 800am, 8:00am, 800pm, 8:00PM, 2000, 20:00,
+# plus hour-only with am/pm (8am, 12pm, 9PM) — minutes are then required
+# unless am/pm is present, which parse_time_input checks on the groups.
 _TIME_RE = re.compile(
-    r'^(\d{1,2}):?(\d{2})\s*(am|pm)?$',
-    re.IGNORECASE,
-)
-# Matches hour-only with am/pm: 8am, 12pm, 9PM
-_TIME_HOUR_RE = re.compile(
-    r'^(\d{1,2})\s*(am|pm)$',
+    r'^(\d{1,2})(?::?(\d{2}))?\s*(am|pm)?$',
     re.IGNORECASE,
 )
 
@@ -84,19 +104,15 @@ def parse_time_input(raw: str) -> str | None:
     Accepts: 800, 0800, 8:00, 800am, 8:00am, 800pm, 8:00PM, 2000, 20:00
     Returns normalized "HH:MM" string or None if invalid.
     """
-    raw = raw.strip()
-    m = _TIME_RE.match(raw)
-    if m:
-        hour = int(m.group(1))
-        minute = int(m.group(2))
-        meridiem = (m.group(3) or "").lower()
-    else:
-        m = _TIME_HOUR_RE.match(raw)
-        if not m:
-            return None
-        hour = int(m.group(1))
-        minute = 0
-        meridiem = m.group(2).lower()
+    m = _TIME_RE.match(raw.strip())
+    if not m:
+        return None
+    hour_str, minute_str, meridiem = m.groups()
+    if minute_str is None and meridiem is None:
+        return None  # Bare hour like "8" is ambiguous
+    hour = int(hour_str)
+    minute = int(minute_str) if minute_str else 0
+    meridiem = (meridiem or "").lower()
 
     if meridiem == "am":
         if hour == 12:
@@ -121,6 +137,7 @@ def parse_time_input(raw: str) -> str | None:
     return f"{hour:02d}:{minute:02d}"
 
 
+@lru_cache(maxsize=512)
 def format_time_12h(hhmm: str) -> str:
     """Convert "HH:MM" to human-readable 12-hour format.
 
@@ -1,5 +1,6 @@
 """Watch, pending, status polling, and heartbeat routes."""
 
+import asyncio
 import time
 
 from fastapi import APIRouter, Request
@@ -158,6 +159,19 @@ async def api_status(request: Request, video_id: str):
     return JSONResponse({"status": video["status"]})
 
 
+def _record_heartbeat_usage(cs, wl_cfg, video: dict, seconds: int, position_seconds):
+    """Log one heartbeat, then read back the video's category and today's usage.
+
+    Returns (category, category time info, simple time info); the simple
+    info is only computed when no category limits are configured.
+    """
+    cs.record_heartbeat(video["video_id"], seconds, position_seconds)
+    video_cat = resolve_video_category(video, store=cs)
+    cat_info = get_category_time_info(store=cs, wl_cfg=wl_cfg)
+    time_info = None if cat_info else get_time_limit_info(store=cs, wl_cfg=wl_cfg)
+    return video_cat, cat_info, time_info
+
+
 @router.post("/api/watch-heartbeat")
 @limiter.limit("30/minute")
 async def watch_heartbeat(request: Request, body: HeartbeatRequest):
@@ -202,14 +216,12 @@ async def watch_heartbeat(request: Request, body: HeartbeatRequest):
         for k in stale:
             del last_hb[k]
 
-    if seconds > 0:
-        cs.record_watch_seconds(vid, seconds)
-    if body.position_seconds is not None:
-        cs.update_playback_position(vid, body.position_seconds)
+    # The write and the day's usage totals run in a worker thread so SQLite
+    # never blocks the event loop
+    video_cat, cat_info, time_info = await asyncio.to_thread(
+        _record_heartbeat_usage, cs, wl_cfg, video, seconds, body.position_seconds)
 
     # Per-category time limit check
-    video_cat = resolve_video_category(video, store=cs) if video else "fun"
-    cat_info = get_category_time_info(store=cs, wl_cfg=wl_cfg)
     remaining = -1
     time_limit_cb = state.time_limit_notify_cb
     if cat_info:
@@ -219,7 +231,6 @@ async def watch_heartbeat(request: Request, body: HeartbeatRequest):
         if cat_budget.get("exceeded") and time_limit_cb:
             await time_limit_cb(cat_budget["used_min"], cat_budget["limit_min"], video_cat, profile_id)
     else:
-        time_info = get_time_limit_info(store=cs, wl_cfg=wl_cfg)
         remaining = time_info["remaining_sec"] if time_info else -1
         if time_info and time_info["exceeded"] and time_limit_cb:
             await time_limit_cb(time_info["used_min"], time_info["limit_min"], "", profile_id)